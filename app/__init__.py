@@ -1,15 +1,19 @@
 from flask import Flask, jsonify
 from app.config import config
-from app.extensions import init_extensions
+from app.extensions import init_extensions, init_logging
 from app.routes import register_blueprints
 from app.database.mongo import create_indexes
+from app.utils.converters import ObjectIdConverter
 
 def create_app(config_name='default'):
     app = Flask(__name__)
     app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024 
     app.config.from_object(config[config_name])
     
+    init_logging(app)
     init_extensions(app)
+    # Must be in place before blueprints add their URL rules
+    app.url_map.converters["oid"] = ObjectIdConverter
     register_blueprints(app)
     
     # Create database indexes
@@ -34,6 +34,9 @@ class Config:
     # File Upload
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB max upload
     
+    # Local directory Reports Hub files may be served from (unset = S3 only)
+    REPORTS_DIR = os.getenv("REPORTS_DIR")
+    
     # Valid User Roles
     VALID_ROLES = [
         "super_admin",
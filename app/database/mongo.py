@@ -174,10 +174,27 @@ def create_indexes():
         # Ideas collection indexes
         ideas_coll.create_index("userId")
         ideas_coll.create_index("domain")
+        ideas_coll.create_index("subDomain")
+        ideas_coll.create_index("stage")
+        ideas_coll.create_index("trl")
+        ideas_coll.create_index("collegeId")
         ideas_coll.create_index("overallScore")
         ideas_coll.create_index([("createdAt", -1)])
         ideas_coll.create_index([("isDeleted", 1), ("userId", 1)])
         
+        # ✅ NEW: Reports Hub role-scoped query indexes
+        users_coll.create_index([("collegeId", 1), ("role", 1), ("isDeleted", 1)])
+        users_coll.create_index([("ttcCoordinatorId", 1), ("role", 1), ("isDeleted", 1)])
+        # Role filter (equality), export sort, then isDeleted ($ne is a range) -
+        # equality/sort/range order keeps the sort on the index
+        ideas_coll.create_index([("innovatorId", 1), ("submittedAt", -1), ("isDeleted", 1)])
+        ideas_coll.create_index([("ttcCoordinatorId", 1), ("submittedAt", -1), ("isDeleted", 1)])
+        ideas_coll.create_index([("mentorId", 1), ("submittedAt", -1), ("isDeleted", 1)])
+        ideas_coll.create_index([("consultationMentorId", 1), ("consultationScheduledAt", -1), ("isDeleted", 1)])
+        
+        # ✅ NEW: Validation results lookup (joined by the idea report endpoints)
+        results_coll.create_index([("ideaId", 1)], name="ideaId_idx")
+        
         # Drafts collection indexes
         drafts_coll.create_index("userId")
         drafts_coll.create_index([("isDeleted", 1), ("userId", 1)])
@@ -220,7 +237,9 @@ def create_indexes():
 
         # ✅ NEW: Reports Hub indexes
         generated_reports_coll.create_index([("userId", 1), ("createdAt", -1)])
+        generated_reports_coll.create_index([("userId", 1), ("isDeleted", 1), ("createdAt", -1), ("_id", -1)])  # hub list keyset pagination
         generated_reports_coll.create_index([("status", 1)])
+        generated_reports_coll.create_index([("collegeId", 1), ("type", 1), ("createdAt", -1), ("ideaId", 1)])  # infographic PDF monthly limit
         scheduled_reports_coll.create_index([("userId", 1)])
         scheduled_reports_coll.create_index([("nextRunAt", 1)])
 
@@ -1,4 +1,9 @@
 from flask_cors import CORS
+from flask.logging import default_handler
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
+import queue
 
 def init_extensions(app):
     CORS(app, resources={
@@ -10,3 +15,31 @@ def init_extensions(app):
             "max_age": 3600
         }
     })
+
+
+def init_logging(app):
+    """
+    Emit log records off the request thread. The root logger gets a
+    QueueHandler (an enqueue per record) and its real handlers - stderr by
+    default - are driven by a background QueueListener. app.logger drops
+    Flask's synchronous default handler and propagates to the root.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        return  # already set up (e.g. create_app called twice)
+    
+    handlers = root.handlers[:]
+    if not handlers:
+        stderr = logging.StreamHandler()
+        stderr.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s"))
+        handlers = [stderr]
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    app.logger.removeHandler(default_handler)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
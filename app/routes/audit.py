@@ -296,8 +296,10 @@ def export_audit_trail():
         # Fetch all matching logs (no pagination for export)
         cursor = audit_logs_coll.find(query).sort("timestamp", -1).limit(1000)
         
-        # Generate CSV
-        output = io.StringIO()
+        # Generate CSV straight into one bytes buffer; utf-8-sig writes the
+        # BOM so Excel opens the file as UTF-8
+        bytes_output = io.BytesIO()
+        output = io.TextIOWrapper(bytes_output, encoding='utf-8-sig', newline='')
         writer = csv.writer(output)
         
         # Header
@@ -320,10 +322,9 @@ def export_audit_trail():
                 str(log.get("targetId", "")) if log.get("targetId") else ""
             ])
         
-        # Convert to bytes
-        output.seek(0)
-        bytes_output = io.BytesIO()
-        bytes_output.write(output.getvalue().encode('utf-8-sig'))
+        # Detach so the wrapper doesn't close the buffer when collected
+        output.flush()
+        output.detach()
         bytes_output.seek(0)
         
         filename = f"audit_trail_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
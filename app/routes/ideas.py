@@ -607,6 +607,11 @@ def submit_idea():
     innovator_email = innovator.get('email', '')
     ttc_id = innovator.get('ttcCoordinatorId') or innovator.get('createdBy')
     college_id = innovator.get('collegeId')
+    if not college_id and ttc_id:
+        # Innovators usually belong to a college through their TTC; store
+        # it on the idea so college-scoped checks never walk the chain
+        ttc = find_user(ttc_id)
+        college_id = ttc.get('collegeId') if ttc else None
 
     # CREATE IDEA DOCUMENT
     idea_id = ObjectId()
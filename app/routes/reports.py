@@ -3,7 +3,7 @@ Reports Module - TWO SEPARATE SYSTEMS
 
 1. Idea Validation Reports (Individual idea analysis)
    - GET /api/reports/idea/<idea_id> - Get validation report for one idea
-   - POST /api/reports/idea/<idea_id>/pdf - Generate PDF for one idea
+   - GET /api/reports/idea/<idea_id>/pdf - Download PDF for one idea
 
 2. Reports Hub (Bulk exports & analytics)
    - GET /api/reports/hub/list - List generated reports
@@ -12,34 +12,489 @@ Reports Module - TWO SEPARATE SYSTEMS
    - POST /api/reports/hub/ai/summarize - AI-powered summary
 """
 
-from flask import Blueprint, request, jsonify, current_app, send_file
+from flask import Blueprint, request, jsonify, current_app, send_from_directory, g, redirect, Response, stream_with_context
 from app.middleware.auth import requires_auth, requires_role
 from app.services.auth_service import AuthService
+from app.services.s3_service import S3Service
 from app.database.mongo import (
     ideas_coll, users_coll, results_coll, 
     generated_reports_coll, scheduled_reports_coll,
     idea_versions_coll
 )
-from app.utils.validators import clean_doc, parse_oid, normalize_any_id_field
+from app.utils.validators import clean_doc, parse_oid, normalize_any_id_field, is_oid_hex
 from app.utils.id_helpers import find_user, ids_match
+from app.utils.downloads import set_attachment
+from app.routes.reports_pdf import find_infographic_report, infographic_pdf_response
 from datetime import datetime, timezone, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import ExecutionTimeout
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import hashlib
+import base64
 import csv
 import io
+import itertools
 import logging
-import traceback
+import tempfile
+import threading
+import time
 import os
 
+# orjson Import (optional - faster report serialization)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 reports_bp = Blueprint("reports", __name__, url_prefix="/api/reports")
 logger = logging.getLogger(__name__)
 
 # Initialize Auth Service
 auth_service = AuthService(os.getenv('JWT_SECRET', 'default-secret-key'))
 
+# Idea fields a custom report may filter on. Anything else in the request's
+# "filters" is ignored so callers cannot inject arbitrary query operators or
+# force scans on unindexed fields.
+ALLOWED_FILTERS = {"domain", "subDomain", "stage", "trl", "collegeId"}
+
+def _get_s3_service():
+    return S3Service(
+        current_app.config['S3_BUCKET'],
+        current_app.config['AWS_ACCESS_KEY_ID'],
+        current_app.config['AWS_SECRET_ACCESS_KEY'],
+        current_app.config['AWS_REGION'],
+        current_app.config.get('MAX_CONTENT_LENGTH', 10 * 1024 * 1024)
+    )
+
+
+def _store_report_file(data, filename, user_id):
+    """
+    Upload a generated report so later downloads can redirect to a presigned
+    URL instead of re-running the query.
+    
+    Returns the "s3://<bucket>/<key>" path, or None when S3 is not configured
+    or the upload fails (the export itself still succeeds).
+    """
+    bucket = current_app.config.get('S3_BUCKET')
+    if not bucket:
+        return None
+    try:
+        key = _get_s3_service().upload_report_file(data, user_id, filename)
+        return f"s3://{bucket}/{key}"
+    except Exception as e:
+        logger.warning("⚠️ Failed to store report file %s: %s", filename, e)
+        return None
+
+
+# Hub CSV exports are streamed: rows are flushed to the client in chunks,
+# and the copy kept for storage spills to disk past REPORT_SPOOL_MAX_MEMORY.
+CSV_STREAM_CHUNK_ROWS = 500
+CSV_CURSOR_BATCH_SIZE = 1000
+REPORT_SPOOL_MAX_MEMORY = 5 * 1024 * 1024
+
+
+def _batched_with_users(docs, id_fields, batch_size=CSV_CURSOR_BATCH_SIZE):
+    """
+    Yield (doc, users) pairs, where `users` maps str(user _id) to the
+    {name, email} of every user referenced through `id_fields` in the
+    doc's batch. One $in query per batch replaces a find_user round trip
+    per row, and memory stays bounded by the batch size.
+    """
+    docs = iter(docs)
+    while True:
+        batch = list(itertools.islice(docs, batch_size))
+        if not batch:
+            return
+        ids = {parse_oid(doc[field]) for doc in batch for field in id_fields if doc.get(field)}
+        users = {
+            str(user["_id"]): user
+            for user in users_coll.find({"_id": {"$in": list(ids)}}, {"name": 1, "email": 1})
+        }
+        for doc in batch:
+            yield doc, users
+
+
+def _csv_report_chunks(header, rows, filename, report_doc):
+    """
+    Encode a CSV export chunk by chunk while the rows are being produced.
+    
+    The encoded output is also spooled so the finished file can be stored
+    for later downloads; the generated_reports record (report_doc) is saved
+    after the last row, with the real row count. A report_doc that already
+    has an _id (a pending background report) is updated in place.
+    """
+    line = io.StringIO()
+    writer = csv.writer(line)
+    rows_written = 0
+    report_id = report_doc.get("_id")
+    
+    with tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_MEMORY) as spool:
+        def flush():
+            chunk = line.getvalue().encode("utf-8")
+            line.seek(0)
+            line.truncate(0)
+            spool.write(chunk)
+            return chunk
+        
+        try:
+            line.write("\ufeff")  # BOM so Excel opens the file as UTF-8
+            writer.writerow(header)
+            yield flush()
+            rows = iter(rows)
+            while True:
+                chunk = list(itertools.islice(rows, CSV_STREAM_CHUNK_ROWS))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                rows_written += len(chunk)
+                yield flush()
+        except Exception:
+            # Headers are already sent; all we can do is stop and log
+            logger.exception("❌ CSV stream %s aborted after %s rows", filename, rows_written)
+            if report_id is not None:
+                generated_reports_coll.update_one({"_id": report_id}, {"$set": {"status": "Failed"}})
+            return
+        
+        try:
+            spool.seek(0)
+            report_doc["status"] = "Ready"
+            report_doc["recordCount"] = rows_written
+            report_doc["fileName"] = filename
+            report_doc["filePath"] = _store_report_file(spool, filename, report_doc["userId"])
+            if report_id is not None:
+                fields = {k: v for k, v in report_doc.items() if k != "_id"}
+                generated_reports_coll.update_one({"_id": report_id}, {"$set": fields})
+            else:
+                report_id = generated_reports_coll.insert_one(report_doc).inserted_id
+            logger.info("✅ Wrote %s rows to %s (report %s)", rows_written, filename, report_id)
+        except Exception:
+            logger.exception("❌ Failed to save report record for %s", filename)
+
+
+def _stream_csv_report(header, rows, filename, report_doc):
+    """Stream a CSV export to the client; see _csv_report_chunks."""
+    return set_attachment(Response(
+        stream_with_context(_csv_report_chunks(header, rows, filename, report_doc)),
+        mimetype="text/csv"
+    ), filename)
+
+
+# Idea fields read by the per-idea authorization checks. The idea report
+# endpoints project down to these (plus what they return) so the heavy AI
+# output fields never leave the server.
+IDEA_AUTH_FIELDS = {
+    "innovatorId": 1, "invitedTeam": 1, "collegeId": 1, "ttcCoordinatorId": 1,
+    "consultationMentorId": 1, "mentorId": 1, "isDeleted": 1
+}
+# ... plus version metadata for GET /api/reports/<idea_id>
+IDEA_VERSION_FIELDS = {
+    **IDEA_AUTH_FIELDS,
+    "rootIdeaId": 1, "version": 1, "versionHistory": 1, "submittedAt": 1, "createdAt": 1
+}
+
+# Server-side cap on the per-idea report reads, so a slow plan or a
+# struggling node fails fast (503) instead of pinning the worker
+IDEA_REPORT_MAX_TIME_MS = 2000
+
+# Server-side time budget for Reports Hub queries. A missing index or a
+# super_admin export over the whole collection fails with 503 instead of
+# holding a Mongo thread and a worker. For streamed exports this counts
+# server time only, not the time the client takes to read the file.
+HUB_QUERY_MAX_TIME_MS = 15000
+
+
+def _hub_timeout_response():
+    return jsonify({
+        "error": "Query timed out",
+        "message": "This report took too long to build. Please refine your filters and try again."
+    }), 503
+
+# Role-membership id sets (TTC -> innovators, college -> TTCs), cached
+# briefly per process. Entries are (expires_at, frozenset of str ids).
+ID_SET_CACHE_TTL = 60
+_id_set_cache = {}
+_id_set_cache_lock = threading.Lock()
+
+
+def _cached_id_set(key, load_ids):
+    """
+    Return frozenset(str(id) for id in load_ids()) for `key`, reusing the
+    value for ID_SET_CACHE_TTL seconds. Membership changes (a new innovator
+    or TTC) become visible within that window. Expired entries are pruned
+    whenever a set is (re)loaded.
+    """
+    now = time.monotonic()
+    cached = _id_set_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    ids = frozenset(str(uid) for uid in load_ids())
+    with _id_set_cache_lock:
+        # Drop expired entries so keys for callers that never return
+        # don't pile up for the life of the worker
+        for stale in [k for k, (expires_at, _) in _id_set_cache.items() if expires_at <= now]:
+            del _id_set_cache[stale]
+        _id_set_cache[key] = (now + ID_SET_CACHE_TTL, ids)
+    return ids
+
+
+def _innovator_ids_for_ttc(ttc_id, roles=("innovator", "individual_innovator"), live_only=True):
+    """
+    Return the string ids of the innovators managed by a TTC coordinator as a
+    frozenset, so authorization is a single membership test.
+    """
+    query = {
+        **normalize_any_id_field("ttcCoordinatorId", ttc_id),
+        "role": {"$in": list(roles)}
+    }
+    if live_only:
+        query["isDeleted"] = {"$ne": True}
+    return _cached_id_set(
+        ("ttc_innovators", str(ttc_id), tuple(roles), live_only),
+        lambda: users_coll.distinct("_id", query, maxTimeMS=IDEA_REPORT_MAX_TIME_MS)
+    )
+
+
+def _ttc_ids_for_college(college_id):
+    """String ids of the live TTC coordinators of a college, as a frozenset."""
+    return _cached_id_set(
+        ("college_ttcs", str(college_id)),
+        lambda: users_coll.distinct("_id", {
+            "collegeId": str(college_id),  # TTCs have collegeId
+            "role": "ttc_coordinator",
+            "isDeleted": {"$ne": True}
+        }, maxTimeMS=HUB_QUERY_MAX_TIME_MS)
+    )
+
+
+def _college_admin_authorized(idea, caller_id, innovator_fallback=False):
+    """
+    A college admin (whose user id is the college id) may view an idea that
+    belongs to the college directly or through the idea's TTC coordinator.
+    
+    The caller, the TTC and - when the idea has no TTC and
+    `innovator_fallback` is set - the innovator's TTC are resolved in one
+    aggregation instead of a chain of find_user calls.
+    """
+    ttc_id = idea.get("ttcCoordinatorId")
+    wanted = [caller_id, ttc_id]
+    if not ttc_id and innovator_fallback:
+        wanted.append(idea.get("innovatorId"))
+    
+    pipeline = [
+        {"$match": {"_id": {"$in": [parse_oid(uid) for uid in wanted if uid]}}},
+        {"$project": {"collegeId": 1, "ttcCoordinatorId": 1}}
+    ]
+    if not ttc_id and innovator_fallback:
+        # Innovator -> its TTC coordinator, in the same round trip
+        pipeline.append({"$lookup": {
+            "from": users_coll.name,
+            "let": {"ttc": "$ttcCoordinatorId"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", {"$convert": {
+                    "input": "$$ttc", "to": "objectId", "onError": "$$ttc", "onNull": None
+                }}]}}},
+                {"$project": {"collegeId": 1}}
+            ],
+            "as": "ttc"
+        }})
+    users = {str(u["_id"]): u for u in users_coll.aggregate(pipeline, maxTimeMS=IDEA_REPORT_MAX_TIME_MS)}
+    
+    if str(caller_id) not in users:
+        return False
+    
+    # Direct match (Caller IS the college)
+    if ids_match(caller_id, idea.get("collegeId")):
+        return True
+    
+    # Via TTC Coordinator (Idea or Innovator)
+    if ttc_id:
+        ttc_user = users.get(str(ttc_id))
+    else:
+        innovator = users.get(str(idea.get("innovatorId")))
+        ttc_user = innovator["ttc"][0] if innovator and innovator.get("ttc") else None
+    
+    return bool(ttc_user) and ids_match(caller_id, ttc_user.get("collegeId"))
+
+
+# -------------------------------------------------------------------------
+# Per-role idea authorizers: (idea, caller_id) -> bool
+# -------------------------------------------------------------------------
+def _auth_innovator(idea, caller_id):
+    if ids_match(idea.get("innovatorId"), caller_id):
+        return True
+    caller_user = find_user(caller_id)
+    return bool(caller_user) and caller_user.get("email") in idea.get("invitedTeam", [])
+
+
+def _auth_ttc(idea, caller_id):
+    return str(idea.get("innovatorId")) in _innovator_ids_for_ttc(caller_id)
+
+
+def _auth_mentor(idea, caller_id):
+    return ids_match(idea.get("consultationMentorId"), caller_id)
+
+
+def _auth_internal_mentor(idea, caller_id):
+    return ids_match(idea.get("mentorId"), caller_id)
+
+
+def _auth_allow(idea, caller_id):
+    return True
+
+
+def _auth_deny(idea, caller_id):
+    return False
+
+
+# Full report view (GET /api/reports/<idea_id>); unlisted roles are denied
+_AUTHORIZERS = {
+    "innovator": _auth_innovator,
+    "individual_innovator": _auth_innovator,
+    "ttc_coordinator": _auth_ttc,
+    "college_admin": _college_admin_authorized,
+    "mentor": _auth_mentor,
+    "internal_mentor": _auth_internal_mentor,
+    "super_admin": _auth_allow,
+}
+
+# Validation report (GET /api/reports/idea/<idea_id>); only these roles are
+# checked, every other authenticated role may read it
+_IDEA_REPORT_AUTHORIZERS = {
+    "innovator": lambda idea, caller_id: ids_match(idea.get("innovatorId"), caller_id),
+    "ttc_coordinator": lambda idea, caller_id: str(idea.get("innovatorId")) in _innovator_ids_for_ttc(
+        caller_id, roles=("innovator",), live_only=False
+    ),
+    "college_admin": lambda idea, caller_id: _college_admin_authorized(
+        idea, caller_id, innovator_fallback=True
+    ),
+}
+
+
+def _authorize_idea_access(idea, caller_id, caller_role, validation_report=False):
+    """
+    Single entry point for per-idea authorization. `validation_report`
+    selects the GET /idea/<idea_id> policy (checked roles only) instead of
+    the full report policy (unlisted roles denied).
+    """
+    if validation_report:
+        authorize = _IDEA_REPORT_AUTHORIZERS.get(caller_role, _auth_allow)
+    else:
+        authorize = _AUTHORIZERS.get(caller_role, _auth_deny)
+    return authorize(idea, caller_id)
+
+
+def _orjson_default(obj):
+    # ObjectId -> str as in clean_doc (datetimes are handled natively by
+    # orjson). clean_doc drops bytes fields rather than nulling them, which
+    # a default hook cannot do, so bytes raise and take the clean_doc path.
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError
+
+
+def _report_etag(result_doc, *extra):
+    """
+    Validator for a stored validation result: its id and last write
+    time, plus anything else the response embeds (e.g. version history).
+    """
+    stamp = result_doc.get("updatedAt") or result_doc.get("createdAt")
+    raw = "|".join(str(part) for part in (result_doc.get("_id"), stamp, *extra))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _report_not_modified(etag):
+    """Return a 304 response if the client already holds `etag`, else None."""
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def _report_json_response(payload, status=200, etag=None):
+    """
+    Serialize a report payload holding raw Mongo documents in a single pass
+    with orjson when it is installed; otherwise clean_doc + jsonify.
+    Only used for validation result documents, which carry no credentials.
+    """
+    response = None
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(payload, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+            response = current_app.response_class(body, status=status, mimetype="application/json")
+        except TypeError:
+            pass  # bytes fields, integers beyond 64 bits - let the slow path handle it
+    if response is None:
+        response = jsonify(clean_doc(payload))
+        response.status_code = status
+    if etag:
+        # Per-user authorization: cache privately and always revalidate
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _find_idea_with_result(coll, idea_oid, projection=None, result_projection=None):
+    """
+    Fetch a live idea (or idea version) from `coll` together with its
+    validation result in one round trip.
+    
+    The result is joined with an uncorrelated $lookup on the results
+    collection's ideaId, so both reads hit an index. `projection` and
+    `result_projection` limit the idea and result fields returned.
+    Returns (idea_doc, result_doc); either may be None.
+    """
+    result_pipeline = [
+        # Producers store ideaId as a string or an ObjectId; $in on both
+        # forms stays on the ideaId index either way
+        {"$match": {"ideaId": {"$in": [str(idea_oid), idea_oid]}}},
+        {"$limit": 1}
+    ]
+    if result_projection:
+        result_pipeline.append({"$project": result_projection})
+    
+    pipeline = [
+        {"$match": {"_id": idea_oid, "isDeleted": {"$ne": True}}},
+        {"$limit": 1}
+    ]
+    if projection:
+        pipeline.append({"$project": projection})
+    pipeline += [
+        {"$lookup": {
+            "from": results_coll.name,
+            "pipeline": result_pipeline,
+            "as": "_result"
+        }}
+    ]
+    doc = next(coll.aggregate(pipeline, maxTimeMS=IDEA_REPORT_MAX_TIME_MS), None)
+    if not doc:
+        return None, None
+    result = doc.pop("_result")
+    return doc, (result[0] if result else None)
+
+
+def _fmt_date(value, fmt="%Y-%m-%d %H:%M", default=""):
+    """Format an optional datetime field for CSV/list output."""
+    return value.strftime(fmt) if value else default
+
+
+def _parse_iso(value):
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z'. Raises ValueError."""
+    if not isinstance(value, str):
+        raise ValueError(f"expected an ISO-8601 string, got {type(value).__name__}")
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 # =========================================================================
 # SYSTEM 1: IDEA VALIDATION REPORTS report get 
 # =========================================================================
-@reports_bp.route("/share/<idea_id>", methods=["POST"])
+@reports_bp.route("/share/<oid:idea_id>", methods=["POST"])
 @requires_auth()
 def generate_guest_report_token(idea_id):
     """
@@ -49,28 +504,24 @@ def generate_guest_report_token(idea_id):
     Auth: Requires user to have access to the idea first.
     """
     try:
-        # Validate idea ID
-        try:
-            idea_oid = ObjectId(idea_id)
-        except:
-            return jsonify({"error": "Invalid idea ID format"}), 400
+        idea_oid = idea_id  # ObjectId, validated by the route converter
 
         # 1. Determine Root Idea (to grant access to full history)
         root_idea_id = None
         root_idea = None
         
         # Check if it's a root idea
-        root_idea_check = ideas_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}})
+        root_idea_check = ideas_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}}, IDEA_AUTH_FIELDS)
         if root_idea_check:
             root_idea_id = idea_oid
             root_idea = root_idea_check
         else:
             # Check if it's a version
-            version_doc = idea_versions_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}})
+            version_doc = idea_versions_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}}, {"rootIdeaId": 1})
             if version_doc:
                 root_idea_id = version_doc.get("rootIdeaId")
                 # Fetch root idea for auth check
-                root_idea = ideas_coll.find_one({"_id": root_idea_id, "isDeleted": {"$ne": True}})
+                root_idea = ideas_coll.find_one({"_id": root_idea_id, "isDeleted": {"$ne": True}}, IDEA_AUTH_FIELDS)
         
         if not root_idea:
             return jsonify({"error": "Idea not found"}), 404
@@ -118,12 +569,11 @@ def generate_guest_report_token(idea_id):
         }), 200
 
     except Exception as e:
-        logger.error(f"Failed to generate guest token: {e}")
-        traceback.print_exc()
+        logger.exception("Failed to generate guest token for idea %s", idea_id)
         return jsonify({"error": "Failed to generate token"}), 500
 
 
-@reports_bp.route("/<idea_id>", methods=["GET"])
+@reports_bp.route("/<oid:idea_id>", methods=["GET"])
 # @requires_auth()  <-- REMOVED to handle guest tokens manually
 def get_report_by_idea_id(idea_id):
     """
@@ -158,19 +608,18 @@ def get_report_by_idea_id(idea_id):
         # ========================================
         # STEP 1: DETERMINE COLLECTION & ROOT IDEA
         # ========================================
-        # Convert idea_id to ObjectId
-        try:
-            idea_oid = ObjectId(idea_id) if isinstance(idea_id, str) else idea_id
-        except Exception as e:
-            return jsonify({"error": "Invalid idea ID format"}), 400
+        idea_oid = idea_id  # ObjectId, validated by the route converter
         
         root_idea = None
         current_idea_doc = None
         is_version = False
         root_idea_id = None
         
-        # Check if it's in ideas_coll (root idea)
-        root_idea = ideas_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}})
+        # Check if it's in ideas_coll (root idea); the validation result for
+        # the requested id is joined in the same round trip
+        root_idea, result_doc = _find_idea_with_result(
+            ideas_coll, idea_oid, projection=IDEA_VERSION_FIELDS
+        )
         
         if root_idea:
             root_idea_id = idea_oid
@@ -178,7 +627,9 @@ def get_report_by_idea_id(idea_id):
             is_version = False
         else:
             # Check if it's in idea_versions_coll
-            version_doc = idea_versions_coll.find_one({"_id": idea_oid, "isDeleted": {"$ne": True}})
+            version_doc, result_doc = _find_idea_with_result(
+                idea_versions_coll, idea_oid, projection=IDEA_VERSION_FIELDS
+            )
             
             if version_doc:
                 root_idea_id = version_doc.get("rootIdeaId")
@@ -186,7 +637,10 @@ def get_report_by_idea_id(idea_id):
                 is_version = True
                 
                 # Get the root idea for authorization and version history
-                root_idea = ideas_coll.find_one({"_id": root_idea_id, "isDeleted": {"$ne": True}})
+                root_idea = ideas_coll.find_one(
+                    {"_id": root_idea_id, "isDeleted": {"$ne": True}}, IDEA_VERSION_FIELDS,
+                    max_time_ms=IDEA_REPORT_MAX_TIME_MS
+                )
                 
                 if not root_idea:
                     return jsonify({"error": "Root idea not found"}), 404
@@ -205,9 +659,9 @@ def get_report_by_idea_id(idea_id):
             # Verify the token grants access to this specific root idea
             if token_root_id and token_root_id == str(root_idea_id):
                 authorized = True
-                logger.info(f"👤 Guest access granted for idea {idea_id} (Root: {root_idea_id})")
+                logger.debug("👤 Guest access granted for idea %s (Root: %s)", idea_id, root_idea_id)
             else:
-                logger.warning(f"❌ Guest token mismatch. Token Root: {token_root_id}, Actual Root: {root_idea_id}")
+                logger.warning("❌ Guest token mismatch. Token Root: %s, Actual Root: %s", token_root_id, root_idea_id)
                 return jsonify({"error": "Guest token not valid for this idea"}), 403
                 
         # --- PATH B: STANDARD USER ACCESS ---
@@ -217,59 +671,14 @@ def get_report_by_idea_id(idea_id):
             request.user_role = caller_role
             
             # Standard Role Checks
-            if caller_role in ["innovator", "individual_innovator"]:
-                if ids_match(root_idea.get("innovatorId"), caller_id):
-                    authorized = True
-                else:
-                    caller_user = find_user(caller_id)
-                    if caller_user and caller_user.get("email") in root_idea.get("invitedTeam", []):
-                        authorized = True
-            
-            elif caller_role == "ttc_coordinator":
-                innovator_ids = users_coll.distinct("_id", {
-                    **normalize_any_id_field("ttcCoordinatorId", caller_id),
-                    "role": {"$in": ["innovator", "individual_innovator"]},
-                    "isDeleted": {"$ne": True}
-                })
-                if any(ids_match(root_idea.get("innovatorId"), uid) for uid in innovator_ids):
-                    authorized = True
-            
-            elif caller_role == "college_admin":
-                caller_user = find_user(caller_id)
-                if caller_user:
-                    user_college_id = caller_user.get("collegeId")
-                    idea_college_id = root_idea.get("collegeId")
-                    ttc_id = root_idea.get("ttcCoordinatorId")
-                    
-                    # Check direct college match
-                    if ids_match(caller_id, idea_college_id):
-                        authorized = True
-                    # Check via TTC coordinator
-                    elif ttc_id:
-                        ttc_user = find_user(ttc_id)
-                        if ttc_user and ids_match(caller_id, ttc_user.get("collegeId")):
-                            authorized = True
-            
-            elif caller_role == "mentor":
-                if ids_match(root_idea.get("consultationMentorId"), caller_id):
-                    authorized = True
-            
-            elif caller_role == "internal_mentor":
-                if ids_match(root_idea.get("mentorId"), caller_id):
-                    authorized = True
-            
-            elif caller_role == "super_admin":
-                authorized = True
+            authorized = _authorize_idea_access(root_idea, caller_id, caller_role)
             
         if not authorized:
             return jsonify({"error": "Access denied"}), 403
             
         # ========================================
-        # STEP 3: GET RESULT FOR CURRENT VERSION
+        # STEP 3: RESULT FOR CURRENT VERSION (fetched in STEP 1)
         # ========================================
-        # ✅ FIX: Use string ID for results_coll query
-        result_doc = results_coll.find_one({"ideaId": str(idea_id)})
-        
         if not result_doc:
             return jsonify({
                 "success": False,
@@ -294,26 +703,33 @@ def get_report_by_idea_id(idea_id):
         # ========================================
         # STEP 5: RETURN ENHANCED RESPONSE
         # ========================================
-        result_data = clean_doc(result_doc)
+        access_type = "guest" if caller_role == "guest_report_viewer" else "user"
+        etag = _report_etag(result_doc, idea_oid, access_type, len(version_history),
+                            version_history[-1].get("versionId") if version_history else None)
+        not_modified = _report_not_modified(etag)
+        if not_modified:
+            return not_modified
         
         response_data = {
             "success": True,
-            "data": result_data,
+            "data": result_doc,
             "meta": {
                 "isVersion": is_version,
                 "rootIdeaId": str(root_idea_id),
                 "currentIdeaId": str(idea_oid),
                 "currentVersion": current_idea_doc.get("version", 1) if is_version else 1,
-                "accessType": "guest" if caller_role == "guest_report_viewer" else "user"
+                "accessType": access_type
             },
-            "versionHistory": clean_doc(version_history)
+            "versionHistory": version_history
         }
         
-        return jsonify(response_data), 200
+        return _report_json_response(response_data, etag=etag)
         
+    except ExecutionTimeout:
+        logger.warning("⏱️ Report lookup for idea %s exceeded %sms", idea_id, IDEA_REPORT_MAX_TIME_MS)
+        return jsonify({"error": "Report lookup timed out, please retry"}), 503
     except Exception as e:
-        logger.error(f"❌ Failed to get report for idea {idea_id}: {e}")
-        # traceback.print_exc()
+        logger.exception("❌ Failed to get report for idea %s", idea_id)
         return jsonify({
             "error": "Failed to retrieve report",
             "message": str(e)
@@ -323,7 +739,7 @@ def get_report_by_idea_id(idea_id):
 # SYSTEM 1: IDEA VALIDATION REPORTS (Individual idea analysis)
 # =========================================================================
 
-@reports_bp.route("/idea/<idea_id>", methods=["GET"])
+@reports_bp.route("/idea/<oid:idea_id>", methods=["GET"])
 @requires_auth()
 def get_idea_report(idea_id):
     """
@@ -344,16 +760,13 @@ def get_idea_report(idea_id):
     """
     try:
         # Validate & convert ID
-        try:
-            if isinstance(idea_id, str):
-                oid = ObjectId(idea_id)
-            else:
-                oid = idea_id
-        except Exception as e:
-            return jsonify({"error": "Invalid idea ID"}), 400
+        oid = idea_id  # ObjectId, validated by the route converter
         
-        # Check if idea exists and user has access
-        idea = ideas_coll.find_one({"_id": oid, "isDeleted": {"$ne": True}})
+        # Check if idea exists (validation report joined in the same query)
+        idea, report = _find_idea_with_result(
+            ideas_coll, oid,
+            projection={**IDEA_AUTH_FIELDS, "title": 1, "overallScore": 1, "clusterScores": 1}
+        )
         if not idea:
             return jsonify({"error": "Idea not found"}), 404
         
@@ -361,46 +774,10 @@ def get_idea_report(idea_id):
         caller_role = request.user_role
         
         # Authorization check
-        if caller_role == "innovator":
-            if not ids_match(idea.get("innovatorId"), caller_id):
-                return jsonify({"error": "Access denied"}), 403
-        elif caller_role == "ttc_coordinator":
-            innovator_ids = users_coll.distinct("_id", {
-                **normalize_any_id_field("ttcCoordinatorId", caller_id),
-                "role": "innovator"
-            })
-            if not any(ids_match(idea.get("innovatorId"), uid) for uid in innovator_ids):
-                return jsonify({"error": "Access denied"}), 403
-        elif caller_role == "college_admin":
-            caller_user = find_user(caller_id)
-            authorized = False
-            if caller_user:
-                # Check direct college match
-                # Check direct match (Caller IS the college)
-                if ids_match(caller_id, idea.get("collegeId")):
-                    authorized = True
-                else:
-                    # Check via TTC Coordinator (Idea or Innovator)
-                    ttc_id = idea.get("ttcCoordinatorId")
-                    if not ttc_id:
-                         innovator = find_user(idea.get("innovatorId"))
-                         if innovator:
-                             ttc_id = innovator.get("ttcCoordinatorId")
-                    
-                    if ttc_id:
-                        ttc_user = find_user(ttc_id)
-                        if ttc_user:
-                            ttc_college = ttc_user.get("collegeId")
-                            # Check if Caller IS the college of the TTC
-                            if ids_match(caller_id, ttc_college):
-                                authorized = True
-            
-            if not authorized:
-                return jsonify({"error": "Access denied"}), 403
-        
-        # Read from 'results' collection (validation report)
-        report = results_coll.find_one({"ideaId": oid})
+        if not _authorize_idea_access(idea, caller_id, caller_role, validation_report=True):
+            return jsonify({"error": "Access denied"}), 403
         
+        # Validation report from the 'results' collection (fetched above)
         if not report:
             # Return idea data even if report not generated yet
             return jsonify({
@@ -415,35 +792,57 @@ def get_idea_report(idea_id):
                 }
             }), 200
         
-        return jsonify({
+        etag = _report_etag(report)
+        not_modified = _report_not_modified(etag)
+        if not_modified:
+            return not_modified
+        
+        return _report_json_response({
             "success": True,
-            "data": clean_doc(report)
-        }), 200
+            "data": report
+        }, etag=etag)
         
+    except ExecutionTimeout:
+        logger.warning("⏱️ Idea report lookup for %s exceeded %sms", idea_id, IDEA_REPORT_MAX_TIME_MS)
+        return jsonify({"error": "Report lookup timed out, please retry"}), 503
     except Exception as e:
-        current_app.logger.exception(f"Failed to get idea report {idea_id}")
+        current_app.logger.exception("Failed to get idea report %s", idea_id)
         return jsonify({
             "error": "Failed to retrieve report",
             "details": str(e)
         }), 500
 
 
-@reports_bp.route("/idea/<idea_id>/pdf", methods=["GET"])
+@reports_bp.route("/idea/<oid:idea_id>/pdf", methods=["GET"])
 @requires_auth()
 def download_idea_report_pdf(idea_id):
     """
-    Generate and download PDF report for a specific idea.
-    Delegates to reports_pdf.py logic.
+    Download the PDF report for a specific idea.
+    
+    Access follows the validation report policy (same as GET
+    /idea/<idea_id>); the infographic is then rendered in-process, so the
+    infographic endpoint's owner/staff check does not apply a second time.
     """
     try:
-        # TODO: Integrate with existing reports_pdf.py
-        return jsonify({
-            "error": "PDF generation not yet implemented",
-            "message": "Use the existing PDF endpoint"
-        }), 501
+        oid = idea_id  # ObjectId, validated by the route converter
+        
+        idea, report = _find_idea_with_result(
+            ideas_coll, oid, projection=IDEA_AUTH_FIELDS, result_projection={"_id": 1}
+        )
+        if not idea:
+            return jsonify({"error": "Idea not found"}), 404
+        
+        if not _authorize_idea_access(idea, request.user_id, request.user_role, validation_report=True):
+            return jsonify({"error": "Access denied"}), 403
+        
+        report = find_infographic_report(report["_id"]) if report else None
+        if not report:
+            return jsonify({"error": "Report not yet generated"}), 404
+        
+        return infographic_pdf_response(report, request.user_id, request.user_role)
         
     except Exception as e:
-        logger.error(f"PDF generation failed: {e}")
+        logger.error("PDF generation failed: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -452,6 +851,19 @@ def download_idea_report_pdf(idea_id):
 # =========================================================================
 
 def build_role_based_query(caller_id, caller_role, data_source="ideas"):
+    """
+    Role-scoped ideas query for Reports Hub, memoized for the current request.
+    
+    Callers add their own filters to the result, so each call gets a copy.
+    """
+    cache = g.setdefault("_role_query_cache", {})
+    key = (caller_role, str(caller_id), data_source)
+    if key not in cache:
+        cache[key] = _build_role_based_query(caller_id, caller_role, data_source)
+    return deepcopy(cache[key])
+
+
+def _build_role_based_query(caller_id, caller_role, data_source):
     """
     Build MongoDB query based on user role for Reports Hub.
     
@@ -460,12 +872,10 @@ def build_role_based_query(caller_id, caller_role, data_source="ideas"):
     - ideas.ttcCoordinatorId = STRING (TTC who manages the innovator)
     - ideas.innovatorId = ObjectId
     """
-    print("\n" + "=" * 80)
-    print(f"🔧 build_role_based_query()")
-    print("=" * 80)
-    print(f"  caller_id: {caller_id} (type: {type(caller_id)})")
-    print(f"  caller_role: {caller_role}")
-    print(f"  data_source: {data_source}")
+    logger.debug("🔧 build_role_based_query()")
+    logger.debug("  caller_id: %s (type: %s)", caller_id, type(caller_id))
+    logger.debug("  caller_role: %s", caller_role)
+    logger.debug("  data_source: %s", data_source)
     
     base_query = {"isDeleted": {"$ne": True}}
     caller_id_str = str(caller_id)
@@ -473,82 +883,182 @@ def build_role_based_query(caller_id, caller_role, data_source="ideas"):
     # ✅ INNOVATOR: See only their own ideas (innovatorId is ObjectId)
     if caller_role == "innovator" or caller_role == "individual_innovator":
         base_query.update(normalize_any_id_field("innovatorId", caller_id))
-        print(f"  ✅ INNOVATOR: Filter by innovatorId = {caller_id}")
+        logger.debug("  ✅ INNOVATOR: Filter by innovatorId = %s", caller_id)
     
     # ✅ TTC COORDINATOR: See all ideas with ttcCoordinatorId = caller_id (STRING)
     elif caller_role == "ttc_coordinator":
         base_query["ttcCoordinatorId"] = caller_id_str
-        print(f"  ✅ TTC: Filter by ttcCoordinatorId = '{caller_id_str}'")
+        logger.debug("  ✅ TTC: Filter by ttcCoordinatorId = '%s'", caller_id_str)
     
     # ✅ COLLEGE ADMIN: Need to find TTCs first, then get their ideas
     elif caller_role == "college_admin":
-        print(f"  🔧 COLLEGE ADMIN: Finding TTCs for college {caller_id_str}")
+        logger.debug("  🔧 COLLEGE ADMIN: Finding TTCs for college %s", caller_id_str)
         
-        # Step 1: Find all TTCs in this college
-        ttc_ids = users_coll.distinct("_id", {
-            "collegeId": caller_id_str,  # TTCs have collegeId
-            "role": "ttc_coordinator",
-            "isDeleted": {"$ne": True}
-        })
+        # Step 1: Find all TTCs in this college (briefly cached per college)
+        ttc_ids = _ttc_ids_for_college(caller_id_str)
         
-        print(f"     ├─ Found {len(ttc_ids)} TTCs")
+        logger.debug("     ├─ Found %s TTCs", len(ttc_ids))
         
         if ttc_ids:
             # Step 2: Get ideas from these TTCs
-            ttc_ids_str = [str(tid) for tid in ttc_ids]
+            ttc_ids_str = sorted(ttc_ids)
             base_query["ttcCoordinatorId"] = {"$in": ttc_ids_str}
-            print(f"     └─ Filter by ttcCoordinatorId in {ttc_ids_str}")
+            logger.debug("     └─ Filter by ttcCoordinatorId in %s", ttc_ids_str)
         else:
             # No TTCs found = no ideas
-            print(f"     └─ ⚠️ No TTCs found - returning empty result set")
+            logger.debug("     └─ ⚠️ No TTCs found - returning empty result set")
             base_query["_id"] = {"$in": []}
     
     # ✅ EXTERNAL MENTOR: See ideas where they are consultation mentor
     elif caller_role == "mentor":
         base_query.update(normalize_any_id_field("consultationMentorId", caller_id))
-        print(f"  ✅ MENTOR: Filter by consultationMentorId = {caller_id}")
+        logger.debug("  ✅ MENTOR: Filter by consultationMentorId = %s", caller_id)
     
     # ✅ INTERNAL MENTOR: See ideas where they are assigned mentor
     elif caller_role == "internal_mentor":
         base_query.update(normalize_any_id_field("mentorId", caller_id))
-        print(f"  ✅ INTERNAL MENTOR: Filter by mentorId = {caller_id}")
+        logger.debug("  ✅ INTERNAL MENTOR: Filter by mentorId = %s", caller_id)
     
     # ✅ SUPER ADMIN: See everything
     elif caller_role == "super_admin":
-        print(f"  ✅ SUPER ADMIN: No filters (all data)")
+        logger.debug("  ✅ SUPER ADMIN: No filters (all data)")
         pass
     
     else:
-        print(f"  ❌ UNKNOWN ROLE: {caller_role} - returning empty result set")
+        logger.debug("  ❌ UNKNOWN ROLE: %s - returning empty result set", caller_role)
         base_query["_id"] = {"$in": []}
     
+    _apply_data_source_filters(base_query, caller_role, data_source)
+    
+    logger.debug("  📋 Final query: %s", base_query)
+    
+    return base_query
+
+
+def _apply_data_source_filters(base_query, caller_role, data_source):
+    """Add the data-source specific conditions to a role-scoped ideas query."""
     # ========================================
     # APPLY DATA SOURCE SPECIFIC FILTERS
     # ========================================
-    print(f"\n  📊 Data source: {data_source}")
+    logger.debug("  📊 Data source: %s", data_source)
     
     if data_source == "consultations":
-        print(f"  🔧 Adding consultation filters...")
+        logger.debug("  🔧 Adding consultation filters...")
         if caller_role == "mentor":
-            print(f"    ✓ Mentor: Already filtered by consultationMentorId")
+            logger.debug("    ✓ Mentor: Already filtered by consultationMentorId")
             pass
         elif caller_role == "internal_mentor":
-            base_query["mentorId"] = {"$exists": True, "$ne": None}
-            print(f"    ✓ Internal Mentor: Added mentorId existence check")
+            # mentorId is already pinned to the caller; setting it again
+            # here would replace that filter
+            logger.debug("    ✓ Internal Mentor: Already filtered by mentorId")
         else:
             base_query["consultationMentorId"] = {"$exists": True, "$ne": None}
-            print(f"    ✓ Other roles: Added consultationMentorId existence check")
+            logger.debug("    ✓ Other roles: Added consultationMentorId existence check")
     
     elif data_source == "validated_ideas":
-        print(f"  🔧 Adding validated ideas filter...")
+        logger.debug("  🔧 Adding validated ideas filter...")
         base_query["overallScore"] = {"$exists": True, "$ne": None}
-        print(f"    ✓ Added overallScore existence check")
-    
-    print(f"\n  📋 Final query: {base_query}")
-    print("=" * 80)
+        logger.debug("    ✓ Added overallScore existence check")
     
     return base_query
 
+
+def role_scoped_aggregate(caller_id, caller_role, data_source, stages,
+                          extra_match=None, **options):
+    """
+    Run aggregation `stages` over the ideas visible to the caller.
+    
+    For college_admin, build_role_based_query needs a users_coll.distinct
+    round trip to resolve the college's TTCs before ideas can be queried.
+    Here the pipeline instead starts from the college's TTC users and joins
+    their ideas with $lookup, so the whole request is one aggregate call.
+    Every other role is a plain $match on ideas_coll.
+    
+    `extra_match` adds caller filters to the ideas match. Remaining options
+    go to aggregate().
+    
+    Use build_role_based_query when a storable find() filter is needed.
+    """
+    options.setdefault("maxTimeMS", HUB_QUERY_MAX_TIME_MS)
+    if caller_role != "college_admin":
+        query = build_role_based_query(caller_id, caller_role, data_source)
+        query.update(extra_match or {})
+        return ideas_coll.aggregate([{"$match": query}, *stages], **options)
+    
+    idea_filter = _apply_data_source_filters(
+        {"isDeleted": {"$ne": True}}, caller_role, data_source
+    )
+    idea_filter.update(extra_match or {})
+    pipeline = [
+        {"$match": {
+            "collegeId": str(caller_id),
+            "role": "ttc_coordinator",
+            "isDeleted": {"$ne": True}
+        }},
+        # ideas.ttcCoordinatorId is stored as a string
+        {"$project": {"_id": 0, "ttcId": {"$toString": "$_id"}}},
+        {"$lookup": {
+            "from": ideas_coll.name,
+            "localField": "ttcId",
+            "foreignField": "ttcCoordinatorId",
+            "as": "idea"
+        }},
+        {"$unwind": "$idea"},
+        {"$replaceRoot": {"newRoot": "$idea"}},
+        {"$match": idea_filter},
+        *stages
+    ]
+    return users_coll.aggregate(pipeline, **options)
+
+
+def _user_lookup_stages(id_field, alias):
+    """
+    Stages joining the user referenced by `id_field` as `_<alias>`, for
+    export pipelines to project `<alias>Name` / `<alias>Email` from.
+    
+    Ids stored as strings are converted first, so the equality $lookup
+    (localField/foreignField form) still runs against the users _id index.
+    """
+    oid_field = f"_{alias}Oid"
+    return [
+        {"$addFields": {oid_field: {"$convert": {
+            "input": f"${id_field}", "to": "objectId", "onError": f"${id_field}", "onNull": None
+        }}}},
+        {"$lookup": {
+            "from": users_coll.name,
+            "localField": oid_field,
+            "foreignField": "_id",
+            "as": f"_{alias}"
+        }}
+    ]
+
+
+def _user_fields(alias):
+    """$project entries for the name/email of a user joined by _user_lookup_stages."""
+    return {
+        f"{alias}Name": {"$arrayElemAt": [f"$_{alias}.name", 0]},
+        f"{alias}Email": {"$arrayElemAt": [f"$_{alias}.email", 0]}
+    }
+
+def _encode_hub_cursor(doc):
+    """Opaque "after" token for the Reports Hub list: (createdAt, _id)."""
+    raw = f"{doc['createdAt'].isoformat()}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_hub_cursor(token):
+    """Inverse of _encode_hub_cursor; raises ValueError on a malformed token."""
+    try:
+        created_at, _, report_id = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8").partition("|")
+        return datetime.fromisoformat(created_at), parse_oid(report_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+# Fields returned by the Reports Hub list
+HUB_LIST_FIELDS = {"name": 1, "type": 1, "createdAt": 1, "status": 1}
+
+
 @reports_bp.route("/hub/list", methods=["GET"])
 @requires_auth()
 def list_generated_reports():
@@ -556,42 +1066,84 @@ def list_generated_reports():
     Get list of generated reports for Reports Hub.
     This is SEPARATE from idea validation reports.
     """
-    print("list_generated_reports")
     try:
         caller_id = request.user_id
         page = int(request.args.get("page", 1))
         limit = int(request.args.get("limit", 20))
-        skip = (page - 1) * limit
-        
-        # Query generated_reports collection
-        query = {"userId": caller_id, "isDeleted": {"$ne": True}}
-        
-        total = generated_reports_coll.count_documents(query)
-        cursor = generated_reports_coll.find(query).sort("createdAt", -1).skip(skip).limit(limit)
+        after = request.args.get("after")
+        
+        # Query generated_reports collection. Hub exports store
+        # isDeleted=False and PDF usage entries omit it, so "live" is an
+        # equality on [False, None] - point bounds on the index, unlike $ne
+        query = {"userId": caller_id, "isDeleted": {"$in": [False, None]}}
+        
+        if after:
+            # Keyset pagination: continue below the last (createdAt, _id) seen,
+            # so deep pages cost the same as the first and need no count
+            try:
+                after_ts, after_id = _decode_hub_cursor(after)
+            except ValueError:
+                return jsonify({"error": "Invalid 'after' cursor"}), 400
+            query["$or"] = [
+                {"createdAt": {"$lt": after_ts}},
+                {"createdAt": after_ts, "_id": {"$lt": after_id}}
+            ]
+            total = None
+            docs = list(generated_reports_coll.find(
+                query, HUB_LIST_FIELDS
+            ).sort([("createdAt", -1), ("_id", -1)]).limit(limit + 1).max_time_ms(HUB_QUERY_MAX_TIME_MS))
+        else:
+            # Page mode: count and page come back from one aggregation
+            result = next(generated_reports_coll.aggregate([
+                {"$match": query},
+                {"$facet": {
+                    "page": [
+                        {"$sort": {"createdAt": -1, "_id": -1}},
+                        {"$skip": (page - 1) * limit},
+                        {"$limit": limit + 1},
+                        {"$project": HUB_LIST_FIELDS}
+                    ],
+                    "total": [{"$count": "n"}]
+                }}
+            ], maxTimeMS=HUB_QUERY_MAX_TIME_MS))
+            docs = result["page"]
+            total = result["total"][0]["n"] if result["total"] else 0
+        
+        has_more = len(docs) > limit
+        docs = docs[:limit]
         
         reports = []
-        for doc in cursor:
+        for doc in docs:
             reports.append({
                 "id": str(doc.get("_id")),
                 "name": doc.get("name"),
                 "type": doc.get("type"),
-                "date": doc.get("createdAt").strftime("%Y-%m-%d") if doc.get("createdAt") else "",
+                "date": _fmt_date(doc.get("createdAt"), "%Y-%m-%d"),
                 "status": doc.get("status", "Ready")
             })
         
-        return jsonify({
-            "success": True,
-            "data": reports,
-            "pagination": {
+        pagination = {
+            "limit": limit,
+            "nextCursor": _encode_hub_cursor(docs[-1]) if has_more else None
+        }
+        if total is not None:
+            pagination.update({
                 "page": page,
-                "limit": limit,
                 "total": total,
                 "pages": (total + limit - 1) // limit
-            }
+            })
+        
+        return jsonify({
+            "success": True,
+            "data": reports,
+            "pagination": pagination
         }), 200
         
+    except ExecutionTimeout:
+        logger.warning("⏱️ list_generated_reports exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        logger.error(f"Failed to list reports: {e}")
+        logger.error("Failed to list reports: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -602,146 +1154,121 @@ def export_ideas_summary():
     CSV export of all ideas (Reports Hub - bulk export).
     DIFFERENT from individual idea reports.
     """
-    print("=" * 80)
-    print("📊 IDEAS SUMMARY EXPORT STARTED")
-    print("=" * 80)
+    logger.debug("📊 IDEAS SUMMARY EXPORT STARTED")
     
     try:
         caller_id = request.user_id
         caller_role = request.user_role
+        now = datetime.now(timezone.utc)
+        now_local = now.astimezone()
         
-        print(f"👤 Caller ID: {caller_id} (type: {type(caller_id)})")
-        print(f"👤 Caller Role: {caller_role}")
-        
-        logger.info(f"📊 Ideas summary requested by {caller_role}: {caller_id}")
+        logger.debug("👤 Caller ID: %s (type: %s)", caller_id, type(caller_id))
+        logger.debug("👤 Caller Role: %s", caller_role)
         
-        # Build role-based query
-        print("\n🔧 Building role-based query...")
-        query = build_role_based_query(caller_id, caller_role, "ideas")
+        logger.info("📊 Ideas summary requested by %s: %s", caller_role, caller_id)
         
         # Optional filters
         domain_filter = request.args.get("domain")
         stage_filter = request.args.get("stage")
         
-        print(f"🎯 Domain filter: {domain_filter}")
-        print(f"🎯 Stage filter: {stage_filter}")
+        logger.debug("🎯 Domain filter: %s", domain_filter)
+        logger.debug("🎯 Stage filter: %s", stage_filter)
         
+        filters = {}
         if domain_filter:
-            query["domain"] = domain_filter
+            filters["domain"] = domain_filter
         
         if stage_filter:
-            query["stage"] = stage_filter
-        
-        # ✅ ADD: Debug logging
-        print(f"\n🔍 Final Query: {query}")
-        logger.info(f"🔍 Query: {query}")
-        
-        # Fetch ideas
-        print("\n🔎 Fetching ideas from database...")
-        ideas = list(ideas_coll.find(query).sort("submittedAt", -1))
-        
-        print(f"✅ Found {len(ideas)} ideas for export")
-        logger.info(f"✅ Found {len(ideas)} ideas for export")
+            filters["stage"] = stage_filter
+        
+        # Fetch ideas with innovator/mentor joined server-side, projected
+        # down to the CSV columns - one aggregate, iterated as a cursor
+        logger.debug("🔎 Fetching ideas from database...")
+        pipeline = [
+            {"$sort": {"submittedAt": -1}},
+            # Drop the heavy idea fields before the joins
+            {"$project": {
+                "title": 1, "innovatorId": 1, "mentorId": 1, "domain": 1, "subDomain": 1,
+                "trl": 1, "overallScore": 1, "stage": 1, "submittedAt": 1,
+                "ttcCoordinatorId": 1, "collegeId": 1
+            }},
+            *_user_lookup_stages("innovatorId", "innovator"),
+            *_user_lookup_stages("mentorId", "mentor"),
+            {"$project": {
+                "title": 1, "domain": 1, "subDomain": 1, "trl": 1, "overallScore": 1,
+                "stage": 1, "submittedAt": 1, "ttcCoordinatorId": 1, "collegeId": 1,
+                **_user_fields("innovator"),
+                "mentorName": {"$arrayElemAt": ["$_mentor.name", 0]}
+            }}
+        ]
+        cursor = role_scoped_aggregate(
+            caller_id, caller_role, "ideas", pipeline,
+            extra_match=filters,
+            allowDiskUse=True, batchSize=CSV_CURSOR_BATCH_SIZE
+        )
+        first_idea = next(cursor, None)
         
-        if len(ideas) == 0:
-            print("⚠️ No ideas found - returning 404")
-            print("=" * 80)
+        if first_idea is None:
+            logger.debug("⚠️ No ideas found - returning 404")
             return jsonify({
                 "error": "No data available",
-                "message": f"No ideas found for {caller_role}. Query: {query}"
+                "message": f"No ideas found for {caller_role}."
             }), 404
         
-        # Show sample of ideas found
-        print(f"\n📋 Sample of ideas found:")
-        for i, idea in enumerate(ideas[:3], 1):
-            print(f"  {i}. {idea.get('title', 'Untitled')} (ID: {idea.get('_id')})")
-            print(f"     - Innovator: {idea.get('innovatorId')}")
-            print(f"     - TTC: {idea.get('ttcCoordinatorId')}")
-            print(f"     - College: {idea.get('collegeId')}")
-        
-        # Generate CSV
-        print("\n📝 Generating CSV...")
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header row
-        writer.writerow([
-            "Idea ID", "Title", "Innovator Name", "Innovator Email",
-            "Domain", "Subdomain", "TRL", "Overall Score", "Stage",
-            "Submitted Date", "Mentor", "TTC ID", "College ID"
-        ])
+        ideas = itertools.chain([first_idea], cursor)
         
-        # Data rows
-        rows_written = 0
-        for idea in ideas:
-            innovator = find_user(idea.get("innovatorId"))
-            mentor = find_user(idea.get("mentorId")) if idea.get("mentorId") else None
-            
-            writer.writerow([
-                str(idea.get("_id")),
-                idea.get("title", ""),
-                innovator.get("name", "") if innovator else "",
-                innovator.get("email", "") if innovator else "",
-                idea.get("domain", ""),
-                idea.get("subDomain", ""),
-                idea.get("trl", ""),
-                idea.get("overallScore", "N/A"),
-                idea.get("stage", ""),
-                idea.get("submittedAt").strftime("%Y-%m-%d %H:%M") if idea.get("submittedAt") else "",
-                mentor.get("name", "") if mentor else "",
-                str(idea.get("ttcCoordinatorId", "")),
-                str(idea.get("collegeId", ""))
-            ])
-            rows_written += 1
-        
-        print(f"✅ Wrote {rows_written} rows to CSV")
-        
-        # Save record in generated_reports collection
-        print("\n💾 Saving report record to database...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 First idea found:")
+            logger.debug("  %s (ID: %s)", first_idea.get('title', 'Untitled'), first_idea.get('_id'))
+            logger.debug("     - Innovator: %s", first_idea.get('innovatorName'))
+            logger.debug("     - TTC: %s", first_idea.get('ttcCoordinatorId'))
+            logger.debug("     - College: %s", first_idea.get('collegeId'))
+        
+        filename = f"ideas_summary_{now.strftime('%Y%m%d_%H%M%S')}.csv"
         report_doc = {
             "userId": caller_id,
-            "name": f"Ideas Summary - {datetime.now().strftime('%Y-%m-%d')}",
+            "name": f"Ideas Summary - {now_local.strftime('%Y-%m-%d')}",
             "type": "CSV",
             "status": "Ready",
-            "recordCount": len(ideas),
-            "createdAt": datetime.now(timezone.utc),
+            "createdAt": now,
             "isDeleted": False
         }
-        result = generated_reports_coll.insert_one(report_doc)
-        print(f"✅ Report record saved with ID: {result.inserted_id}")
-        
-        # Convert to bytes
-        print("\n📦 Converting to downloadable file...")
-        output.seek(0)
-        bytes_output = io.BytesIO()
-        bytes_output.write(output.getvalue().encode('utf-8-sig'))
-        bytes_output.seek(0)
-        
-        filename = f"ideas_summary_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        print(f"✅ Generated CSV: {filename}")
-        print(f"📁 File size: {len(bytes_output.getvalue())} bytes")
-        logger.info(f"✅ Generated CSV: {filename}")
-        
-        print("=" * 80)
-        print("✅ IDEAS SUMMARY EXPORT COMPLETED SUCCESSFULLY")
-        print("=" * 80)
-        
-        return send_file(
-            bytes_output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
-        )
         
+        header = [
+            "Idea ID", "Title", "Innovator Name", "Innovator Email",
+            "Domain", "Subdomain", "TRL", "Overall Score", "Stage",
+            "Submitted Date", "Mentor", "TTC ID", "College ID"
+        ]
+        
+        def rows():
+            for idea in ideas:
+                yield [
+                    str(idea.get("_id")),
+                    idea.get("title", ""),
+                    idea.get("innovatorName", ""),
+                    idea.get("innovatorEmail", ""),
+                    idea.get("domain", ""),
+                    idea.get("subDomain", ""),
+                    idea.get("trl", ""),
+                    idea.get("overallScore", "N/A"),
+                    idea.get("stage", ""),
+                    _fmt_date(idea.get("submittedAt")),
+                    idea.get("mentorName", ""),
+                    str(idea.get("ttcCoordinatorId", "")),
+                    str(idea.get("collegeId", ""))
+                ]
+        
+        # Stream the CSV; the report record is saved once the last row is sent
+        logger.debug("📤 Streaming CSV: %s", filename)
+        logger.info("📤 Streaming ideas summary: %s", filename)
+        
+        return _stream_csv_report(header, rows(), filename, report_doc)
+        
+    except ExecutionTimeout:
+        logger.warning("⏱️ export_ideas_summary exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        print("=" * 80)
-        print(f"❌ ERROR in export_ideas_summary: {type(e).__name__}")
-        print(f"❌ Message: {str(e)}")
-        print("=" * 80)
-        logger.error(f"❌ Failed to generate ideas summary: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Failed to generate ideas summary")
         return jsonify({"error": str(e)}), 500
 
 
@@ -751,121 +1278,101 @@ def export_consultations():
     """
     CSV export of consultation history (Reports Hub).
     """
-    print("=" * 80)
-    print("📊 CONSULTATIONS EXPORT STARTED")
-    print("=" * 80)
+    logger.debug("📊 CONSULTATIONS EXPORT STARTED")
     
     try:
         caller_id = request.user_id
         caller_role = request.user_role
+        now = datetime.now(timezone.utc)
+        now_local = now.astimezone()
+        
+        logger.debug("👤 Caller ID: %s (type: %s)", caller_id, type(caller_id))
+        logger.debug("👤 Caller Role: %s", caller_role)
+        
+        logger.info("📊 Consultation export requested by %s: %s", caller_role, caller_id)
+        
+        # Consultations with innovator/mentor joined server-side
+        logger.debug("🔎 Fetching consultations from database...")
+        pipeline = [
+            {"$sort": {"consultationScheduledAt": -1}},
+            # Drop the heavy idea fields before the joins
+            {"$project": {
+                "title": 1, "innovatorId": 1, "consultationMentorId": 1, "consultationStatus": 1,
+                "consultationScheduledAt": 1, "consultationNotes": 1
+            }},
+            *_user_lookup_stages("innovatorId", "innovator"),
+            *_user_lookup_stages("consultationMentorId", "mentor"),
+            {"$project": {
+                "title": 1, "consultationStatus": 1, "consultationScheduledAt": 1,
+                "consultationNotes": 1, "consultationMentorId": 1,
+                **_user_fields("innovator"),
+                **_user_fields("mentor"),
+                "mentorFound": {"$gt": [{"$size": "$_mentor"}, 0]}
+            }}
+        ]
+        cursor = role_scoped_aggregate(
+            caller_id, caller_role, "consultations", pipeline,
+            allowDiskUse=True, batchSize=CSV_CURSOR_BATCH_SIZE
+        )
+        first_consultation = next(cursor, None)
         
-        print(f"👤 Caller ID: {caller_id} (type: {type(caller_id)})")
-        print(f"👤 Caller Role: {caller_role}")
-        
-        logger.info(f"📊 Consultation export requested by {caller_role}: {caller_id}")
-        
-        print("\n🔧 Building role-based query for consultations...")
-        query = build_role_based_query(caller_id, caller_role, "consultations")
-        
-        print(f"🔍 Final Query: {query}")
-        
-        print("\n🔎 Fetching consultations from database...")
-        consultations = list(ideas_coll.find(query).sort("consultationScheduledAt", -1))
-        
-        print(f"✅ Found {len(consultations)} consultations")
-        logger.info(f"✅ Found {len(consultations)} consultations")
-        
-        if len(consultations) == 0:
-            print("⚠️ No consultations found - returning 404")
-            print("=" * 80)
+        if first_consultation is None:
+            logger.debug("⚠️ No consultations found - returning 404")
             return jsonify({
                 "error": "No consultations found",
-                "message": f"No consultation data available for {caller_role}. Query: {query}"
+                "message": f"No consultation data available for {caller_role}."
             }), 404
         
-        # Show sample of consultations found
-        print(f"\n📋 Sample of consultations found:")
-        for i, idea in enumerate(consultations[:3], 1):
-            print(f"  {i}. {idea.get('title', 'Untitled')} (ID: {idea.get('_id')})")
-            print(f"     - Mentor: {idea.get('consultationMentorId')}")
-            print(f"     - Status: {idea.get('consultationStatus', 'N/A')}")
-            print(f"     - Scheduled: {idea.get('consultationScheduledAt')}")
-        
-        # Generate CSV
-        print("\n📝 Generating CSV...")
-        output = io.StringIO()
-        writer = csv.writer(output)
+        consultations = itertools.chain([first_consultation], cursor)
         
-        writer.writerow([
-            "Idea ID", "Idea Title", "Innovator", "Innovator Email",
-            "Consultant Mentor", "Mentor Email", "Status", 
-            "Scheduled Date", "Consultation Notes"
-        ])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 First consultation found:")
+            logger.debug("  %s (ID: %s)", first_consultation.get('title', 'Untitled'), first_consultation.get('_id'))
+            logger.debug("     - Mentor: %s", first_consultation.get('consultationMentorId'))
+            logger.debug("     - Status: %s", first_consultation.get('consultationStatus', 'N/A'))
+            logger.debug("     - Scheduled: %s", first_consultation.get('consultationScheduledAt'))
         
-        rows_written = 0
-        for idea in consultations:
-            innovator = find_user(idea.get("innovatorId"))
-            mentor = find_user(idea.get("consultationMentorId"))
-            
-            writer.writerow([
-                str(idea.get("_id")),
-                idea.get("title", ""),
-                innovator.get("name", "") if innovator else "",
-                innovator.get("email", "") if innovator else "",
-                mentor.get("name", "") if mentor else "Unassigned",
-                mentor.get("email", "") if mentor else "",
-                idea.get("consultationStatus", "assigned"),
-                idea.get("consultationScheduledAt").strftime("%Y-%m-%d %H:%M") if idea.get("consultationScheduledAt") else "Not scheduled",
-                idea.get("consultationNotes", "")
-            ])
-            rows_written += 1
-        
-        print(f"✅ Wrote {rows_written} rows to CSV")
-        
-        # Save record
-        print("\n💾 Saving report record to database...")
+        filename = f"consultations_{now.strftime('%Y%m%d_%H%M%S')}.csv"
         report_doc = {
             "userId": caller_id,
-            "name": f"Consultations - {datetime.now().strftime('%Y-%m-%d')}",
+            "name": f"Consultations - {now_local.strftime('%Y-%m-%d')}",
             "type": "CSV",
             "status": "Ready",
-            "recordCount": len(consultations),
-            "createdAt": datetime.now(timezone.utc),
+            "createdAt": now,
             "isDeleted": False
         }
-        result = generated_reports_coll.insert_one(report_doc)
-        print(f"✅ Report record saved with ID: {result.inserted_id}")
-        
-        print("\n📦 Converting to downloadable file...")
-        output.seek(0)
-        bytes_output = io.BytesIO()
-        bytes_output.write(output.getvalue().encode('utf-8-sig'))
-        bytes_output.seek(0)
-        
-        filename = f"consultations_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        print(f"✅ Generated CSV: {filename}")
-        print(f"📁 File size: {len(bytes_output.getvalue())} bytes")
-        
-        print("=" * 80)
-        print("✅ CONSULTATIONS EXPORT COMPLETED SUCCESSFULLY")
-        print("=" * 80)
-        
-        return send_file(
-            bytes_output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
-        )
         
+        header = [
+            "Idea ID", "Idea Title", "Innovator", "Innovator Email",
+            "Consultant Mentor", "Mentor Email", "Status", 
+            "Scheduled Date", "Consultation Notes"
+        ]
+        
+        def rows():
+            for idea in consultations:
+                yield [
+                    str(idea.get("_id")),
+                    idea.get("title", ""),
+                    idea.get("innovatorName", ""),
+                    idea.get("innovatorEmail", ""),
+                    idea.get("mentorName", "") if idea.get("mentorFound") else "Unassigned",
+                    idea.get("mentorEmail", ""),
+                    idea.get("consultationStatus", "assigned"),
+                    _fmt_date(idea.get("consultationScheduledAt"), default="Not scheduled"),
+                    idea.get("consultationNotes", "")
+                ]
+        
+        # Stream the CSV; the report record is saved once the last row is sent
+        logger.debug("📤 Streaming CSV: %s", filename)
+        logger.info("📤 Streaming consultations export: %s", filename)
+        
+        return _stream_csv_report(header, rows(), filename, report_doc)
+        
+    except ExecutionTimeout:
+        logger.warning("⏱️ export_consultations exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        print("=" * 80)
-        print(f"❌ ERROR in export_consultations: {type(e).__name__}")
-        print(f"❌ Message: {str(e)}")
-        print("=" * 80)
-        logger.error(f"❌ Failed to generate consultations report: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Failed to generate consultations report")
         return jsonify({"error": str(e)}), 500
 
 
@@ -875,22 +1382,22 @@ def generate_custom_report():
     """
     Generate custom report (Reports Hub).
     """
-    print("=" * 80)
-    print("📊 CUSTOM REPORT GENERATION STARTED")
-    print("=" * 80)
+    logger.debug("📊 CUSTOM REPORT GENERATION STARTED")
     
     try:
         caller_id = request.user_id
         caller_role = request.user_role
+        now = datetime.now(timezone.utc)
+        now_local = now.astimezone()
         body = request.get_json()
         
-        print(f"👤 Caller ID: {caller_id} (type: {type(caller_id)})")
-        print(f"👤 Caller Role: {caller_role}")
-        print(f"📦 Request Body: {body}")
+        logger.debug("👤 Caller ID: %s (type: %s)", caller_id, type(caller_id))
+        logger.debug("👤 Caller Role: %s", caller_role)
+        logger.debug("📦 Request Body: %s", body)
         
-        logger.info(f"📊 Custom report requested by {caller_role}: {caller_id}")
+        logger.info("📊 Custom report requested by %s: %s", caller_role, caller_id)
         
-        report_name = body.get("reportName", f"Custom Report {datetime.now().strftime('%Y%m%d')}")
+        report_name = body.get("reportName", f"Custom Report {now_local.strftime('%Y%m%d')}")
         format_type = body.get("format", "csv").lower()
         data_source = body.get("dataSource", "ideas")
         date_range = body.get("dateRange", {})
@@ -898,66 +1405,60 @@ def generate_custom_report():
         columns = body.get("columns", [])
         schedule = body.get("schedule")
         
-        print(f"\n📋 Report Configuration:")
-        print(f"   Report Name: {report_name}")
-        print(f"   Format: {format_type}")
-        print(f"   Data Source: {data_source}")
-        print(f"   Date Range: {date_range}")
-        print(f"   Filters: {filters}")
-        print(f"   Columns: {columns}")
-        print(f"   Schedule: {schedule}")
+        logger.debug("📋 Report Configuration:")
+        logger.debug("   Report Name: %s", report_name)
+        logger.debug("   Format: %s", format_type)
+        logger.debug("   Data Source: %s", data_source)
+        logger.debug("   Date Range: %s", date_range)
+        logger.debug("   Filters: %s", filters)
+        logger.debug("   Columns: %s", columns)
+        logger.debug("   Schedule: %s", schedule)
         
         # Build query
-        print(f"\n🔧 Building role-based query...")
+        logger.debug("🔧 Building role-based query...")
         query = build_role_based_query(caller_id, caller_role, data_source)
-        print(f"🔍 Initial query: {query}")
+        logger.debug("🔍 Initial query: %s", query)
         
         # Apply date range
         if date_range.get("from") or date_range.get("to"):
-            print(f"\n📅 Applying date range filter...")
+            logger.debug("📅 Applying date range filter...")
             date_filter = {}
             
-            if date_range.get("from"):
+            for bound, op in (("from", "$gte"), ("to", "$lte")):
+                if not date_range.get(bound):
+                    continue
                 try:
-                    from_date = datetime.fromisoformat(date_range["from"].replace('Z', '+00:00'))
-                    date_filter["$gte"] = from_date
-                    print(f"   ✅ From date: {from_date}")
-                except Exception as e:
-                    print(f"   ⚠️ Failed to parse 'from' date: {e}")
-                    pass
-            
-            if date_range.get("to"):
-                try:
-                    to_date = datetime.fromisoformat(date_range["to"].replace('Z', '+00:00'))
-                    date_filter["$lte"] = to_date
-                    print(f"   ✅ To date: {to_date}")
-                except Exception as e:
-                    print(f"   ⚠️ Failed to parse 'to' date: {e}")
-                    pass
+                    date_filter[op] = _parse_iso(date_range[bound])
+                except ValueError as e:
+                    return jsonify({
+                        "error": f"Invalid '{bound}' date",
+                        "message": f"dateRange.{bound} must be an ISO-8601 date: {e}"
+                    }), 400
+                logger.debug("   ✅ %s date: %s", bound.title(), date_filter[op])
             
             if date_filter:
                 query["submittedAt"] = date_filter
-                print(f"   ✅ Date filter applied: {date_filter}")
+                logger.debug("   ✅ Date filter applied: %s", date_filter)
         else:
-            print(f"\n📅 No date range filter provided")
+            logger.debug("📅 No date range filter provided")
         
         # Apply filters
         if filters:
-            print(f"\n🎯 Applying custom filters...")
+            logger.debug("🎯 Applying custom filters...")
             for key, value in filters.items():
-                if value and value != "all":
+                if key in ALLOWED_FILTERS and value and value != "all":
                     query[key] = value
-                    print(f"   ✅ {key} = {value}")
+                    logger.debug("   ✅ %s = %s", key, value)
                 else:
-                    print(f"   ⏭️  Skipped {key} (value: {value})")
+                    logger.debug("   ⏭️  Skipped %s (value: %s)", key, value)
         else:
-            print(f"\n🎯 No custom filters provided")
+            logger.debug("🎯 No custom filters provided")
         
-        print(f"\n🔍 Final Query: {query}")
+        logger.debug("🔍 Final Query: %s", query)
         
         # Handle scheduling
         if schedule and schedule.get("type") == "scheduled":
-            print(f"\n⏰ Scheduling report for future execution...")
+            logger.debug("⏰ Scheduling report for future execution...")
             
             scheduled_doc = {
                 "userId": caller_id,
@@ -968,16 +1469,15 @@ def generate_custom_report():
                 "columns": columns,
                 "schedule": schedule,
                 "status": "scheduled",
-                "createdAt": datetime.now(timezone.utc),
-                "nextRunAt": datetime.now(timezone.utc) + timedelta(days=1)  # TODO: Calculate properly
+                "createdAt": now,
+                "nextRunAt": now + timedelta(days=1)  # TODO: Calculate properly
             }
             
             result = scheduled_reports_coll.insert_one(scheduled_doc)
-            print(f"✅ Scheduled report saved with ID: {result.inserted_id}")
+            logger.debug("✅ Scheduled report saved with ID: %s", result.inserted_id)
             
-            report_id = f"REP-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            print(f"✅ Report ID: {report_id}")
-            print("=" * 80)
+            report_id = f"REP-{now_local.strftime('%Y%m%d%H%M%S')}"
+            logger.debug("✅ Report ID: %s", report_id)
             
             return jsonify({
                 "success": True,
@@ -986,156 +1486,247 @@ def generate_custom_report():
             }), 200
         
         # Generate immediately
-        print(f"\n⚡ Generating report immediately...")
-        print(f"   Format: {format_type}")
+        logger.debug("⚡ Generating report immediately...")
+        logger.debug("   Format: %s", format_type)
         
         if format_type == "csv":
-            print(f"   ✅ Calling _generate_csv_custom()...")
+            if schedule and schedule.get("type") == "background":
+                logger.debug("   ✅ Queueing background report...")
+                return _enqueue_custom_report(query, columns, report_name, data_source, caller_id)
+            logger.debug("   ✅ Calling _generate_csv_custom()...")
             return _generate_csv_custom(query, columns, report_name, data_source, caller_id)
         else:
-            print(f"   ❌ Invalid format: {format_type}")
-            print("=" * 80)
+            logger.debug("   ❌ Invalid format: %s", format_type)
             return jsonify({"error": f"Invalid format '{format_type}'. Use 'csv'"}), 400
         
+    except ExecutionTimeout:
+        logger.warning("⏱️ generate_custom_report exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        print("=" * 80)
-        print(f"❌ ERROR in generate_custom_report: {type(e).__name__}")
-        print(f"❌ Message: {str(e)}")
-        print("=" * 80)
-        logger.error(f"❌ Custom report generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Custom report generation failed")
         return jsonify({"error": str(e)}), 500
 
 
+# Idea fields each custom-report column reads; the export fetches only the
+# union for the requested columns
+CUSTOM_COLUMN_FIELDS = {
+    "ID": ("_id",),
+    "Title": ("title",),
+    "Innovator Name": ("innovatorId",),
+    "Innovator Email": ("innovatorId",),
+    "Domain": ("domain",),
+    "Subdomain": ("subDomain",),
+    "Score": ("overallScore",),
+    "Stage": ("stage",),
+    "Status": ("status",),
+    "TRL": ("trl",),
+    "Date": ("submittedAt",),
+    "TTC ID": ("ttcCoordinatorId",),
+    "College ID": ("collegeId",),
+}
+
+
+def _innovator_field(doc, users, field):
+    return (users.get(str(doc.get("innovatorId"))) or {}).get(field, "")
+
+
+# Cell extractor per custom-report column: (idea, users) -> value, where
+# users maps str(user _id) to {name, email} for the idea's batch. Keep the
+# keys in step with CUSTOM_COLUMN_FIELDS.
+COLUMN_EXTRACTORS = {
+    "ID": lambda d, users: str(d.get("_id")),
+    "Title": lambda d, users: d.get("title", ""),
+    "Innovator Name": lambda d, users: _innovator_field(d, users, "name"),
+    "Innovator Email": lambda d, users: _innovator_field(d, users, "email"),
+    "Domain": lambda d, users: d.get("domain", ""),
+    "Subdomain": lambda d, users: d.get("subDomain", ""),
+    "Score": lambda d, users: d.get("overallScore", "N/A"),
+    "Stage": lambda d, users: d.get("stage", ""),
+    "Status": lambda d, users: d.get("status", ""),
+    "TRL": lambda d, users: d.get("trl", ""),
+    "Date": lambda d, users: _fmt_date(d.get("submittedAt"), "%Y-%m-%d"),
+    "TTC ID": lambda d, users: d.get("ttcCoordinatorId", ""),
+    "College ID": lambda d, users: d.get("collegeId", "")
+}
+
+
+def _custom_report_projection(columns):
+    """Projection covering the given custom-report columns (all of them if empty)."""
+    wanted = columns or CUSTOM_COLUMN_FIELDS.keys()
+    projection = {field: 1 for col in wanted for field in CUSTOM_COLUMN_FIELDS.get(col, ())}
+    return projection or {"_id": 1}
+
+
+def _unknown_columns_response(columns):
+    """400 response for unsupported custom-report columns, or None if all are known."""
+    unknown = [col for col in (columns or []) if col not in CUSTOM_COLUMN_FIELDS]
+    if not unknown:
+        return None
+    return jsonify({
+        "error": "Unknown columns",
+        "message": f"Unsupported report columns: {', '.join(map(str, unknown))}",
+        "allowedColumns": list(CUSTOM_COLUMN_FIELDS.keys())
+    }), 400
+
+
+def _custom_report_filename(report_name, now):
+    return f"{report_name.replace(' ', '_')}_{now.strftime('%Y%m%d')}.csv"
+
+
+def _custom_report_rows(query, columns):
+    """
+    Run a custom-report query and return (header, rows), where rows lazily
+    yields one list of cell values per idea. Returns None when nothing
+    matches. Columns must already be validated.
+    """
+    logger.debug("🔎 Fetching custom report data...")
+    # Newest submissions first: submittedAt is the sort key of the role
+    # indexes (and what the date range filters on), so no in-memory sort
+    cursor = ideas_coll.find(
+        query, _custom_report_projection(columns)
+    ).sort("submittedAt", -1).batch_size(CSV_CURSOR_BATCH_SIZE).max_time_ms(HUB_QUERY_MAX_TIME_MS)
+    first_item = next(cursor, None)
+    
+    if first_item is None:
+        return None
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📋 First record found:")
+        logger.debug("  %s (ID: %s)", first_item.get('title', 'Untitled'), first_item.get('_id'))
+        logger.debug("     - Domain: %s", first_item.get('domain'))
+        logger.debug("     - Score: %s", first_item.get('overallScore', 'N/A'))
+    
+    # If no columns specified, use all
+    header = list(columns) if columns else list(COLUMN_EXTRACTORS.keys())
+    
+    # Resolve column extractors once, not per row
+    extractors = [COLUMN_EXTRACTORS[col] for col in header]
+    
+    def rows():
+        data = itertools.chain([first_item], cursor)
+        for item, users in _batched_with_users(data, ("innovatorId",)):
+            yield [extract(item, users) for extract in extractors]
+    
+    return header, rows()
+
+
 def _generate_csv_custom(query, columns, report_name, data_source, user_id):
     """Helper to generate CSV from custom query"""
-    print("\n" + "=" * 80)
-    print("📝 _generate_csv_custom() STARTED")
-    print("=" * 80)
+    logger.debug("📝 _generate_csv_custom() STARTED")
     
     try:
-        print(f"📊 Parameters:")
-        print(f"   Query: {query}")
-        print(f"   Columns: {columns}")
-        print(f"   Report Name: {report_name}")
-        print(f"   Data Source: {data_source}")
-        print(f"   User ID: {user_id}")
-        
-        # Fetch data
-        print(f"\n🔎 Fetching data from {data_source} collection...")
-        data = list(ideas_coll.find(query).sort("createdAt", -1))
-        
-        print(f"✅ Found {len(data)} records")
-        
-        if not data:
-            print(f"⚠️ No data found - returning 404")
-            print("=" * 80)
+        now = datetime.now(timezone.utc)
+        
+        logger.debug("📊 Parameters:")
+        logger.debug("   Query: %s", query)
+        logger.debug("   Columns: %s", columns)
+        logger.debug("   Report Name: %s", report_name)
+        logger.debug("   Data Source: %s", data_source)
+        logger.debug("   User ID: %s", user_id)
+        
+        # Reject unknown columns up front instead of emitting blank cells
+        error = _unknown_columns_response(columns)
+        if error:
+            return error
+        
+        built = _custom_report_rows(query, columns)
+        if built is None:
+            logger.debug("⚠️ No data found - returning 404")
             return jsonify({
                 "error": "No data found",
                 "message": "No records match your filter criteria.",
                 "query": query
             }), 404
+        header, rows = built
         
-        # Show sample of data found
-        print(f"\n📋 Sample of data found:")
-        for i, item in enumerate(data[:3], 1):
-            print(f"  {i}. {item.get('title', 'Untitled')} (ID: {item.get('_id')})")
-            print(f"     - Domain: {item.get('domain')}")
-            print(f"     - Score: {item.get('overallScore', 'N/A')}")
-        
-        logger.info(f"✅ Found {len(data)} records for custom report")
-        
-        # Column mapping
-        print(f"\n🗂️  Setting up column mapping...")
-        column_map = {
-            "ID": lambda x: str(x.get("_id")),
-            "Title": lambda x: x.get("title", ""),
-            "Innovator Name": lambda x: find_user(x.get("innovatorId")).get("name", "") if find_user(x.get("innovatorId")) else "",
-            "Innovator Email": lambda x: find_user(x.get("innovatorId")).get("email", "") if find_user(x.get("innovatorId")) else "",
-            "Domain": lambda x: x.get("domain", ""),
-            "Subdomain": lambda x: x.get("subDomain", ""),
-            "Score": lambda x: x.get("overallScore", "N/A"),
-            "Stage": lambda x: x.get("stage", ""),
-            "Status": lambda x: x.get("status", ""),
-            "TRL": lambda x: x.get("trl", ""),
-            "Date": lambda x: x.get("submittedAt").strftime("%Y-%m-%d") if x.get("submittedAt") else "",
-            "TTC ID": lambda x: x.get("ttcCoordinatorId", ""),
-            "College ID": lambda x: x.get("collegeId", "")
-        }
-        
-        # If no columns specified, use all
-        if not columns:
-            columns = list(column_map.keys())
-            print(f"   ℹ️  No columns specified - using all: {columns}")
-        else:
-            print(f"   ✅ Using specified columns: {columns}")
-        
-        # Generate CSV
-        print(f"\n📝 Generating CSV...")
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header row
-        writer.writerow(columns)
-        print(f"   ✅ Header row written: {columns}")
-        
-        # Data rows
-        rows_written = 0
-        for item in data:
-            row = [column_map.get(col, lambda x: "")(item) for col in columns]
-            writer.writerow(row)
-            rows_written += 1
-        
-        print(f"   ✅ Wrote {rows_written} data rows")
-        
-        # Save record
-        print(f"\n💾 Saving report record to database...")
+        filename = _custom_report_filename(report_name, now)
+        # The role-scoped query and columns are kept so the download route
+        # can rebuild the file if it was never stored
         report_doc = {
             "userId": user_id,
             "name": report_name,
             "type": "CSV",
             "status": "Ready",
-            "recordCount": len(data),
-            "createdAt": datetime.now(timezone.utc),
+            "dataSource": data_source,
+            "query": query,
+            "columns": columns,
+            "createdAt": now,
             "isDeleted": False
         }
-        result = generated_reports_coll.insert_one(report_doc)
-        print(f"✅ Report record saved with ID: {result.inserted_id}")
-        
-        # Convert to bytes
-        print(f"\n📦 Converting to downloadable file...")
-        output.seek(0)
-        bytes_output = io.BytesIO()
-        bytes_output.write(output.getvalue().encode('utf-8-sig'))
-        bytes_output.seek(0)
-        
-        filename = f"{report_name.replace(' ', '_')}_{datetime.now(timezone.utc).strftime('%Y%m%d')}.csv"
-        
-        print(f"✅ Generated CSV: {filename}")
-        print(f"📁 File size: {len(bytes_output.getvalue())} bytes")
-        print("=" * 80)
-        print("✅ CSV GENERATION COMPLETED SUCCESSFULLY")
-        print("=" * 80)
-        
-        return send_file(
-            bytes_output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
-        )
+        
+        # Stream the CSV; the report record is saved once the last row is sent
+        logger.debug("📤 Streaming CSV: %s", filename)
+        
+        return _stream_csv_report(header, rows, filename, report_doc)
         
     except Exception as e:
-        print("=" * 80)
-        print(f"❌ ERROR in _generate_csv_custom: {type(e).__name__}")
-        print(f"❌ Message: {str(e)}")
-        print("=" * 80)
-        logger.error(f"❌ CSV generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ CSV generation failed")
         raise
 
 
+# Background custom reports. Each job builds the CSV outside the request,
+# stores it through _store_report_file and flips its generated_reports
+# record from Pending to Ready (or Failed); clients poll /hub/list and
+# fetch the file through /hub/download/<report_id>.
+BACKGROUND_REPORT_WORKERS = 2
+_report_executor = ThreadPoolExecutor(
+    max_workers=BACKGROUND_REPORT_WORKERS, thread_name_prefix="hub-report"
+)
+
+
+def _build_custom_report(app, report_id, report_doc):
+    """Background job body for a pending custom report."""
+    with app.app_context():
+        try:
+            built = _custom_report_rows(report_doc["query"], report_doc["columns"])
+            if built is None:
+                generated_reports_coll.update_one(
+                    {"_id": report_id},
+                    {"$set": {"status": "Failed", "recordCount": 0,
+                              "error": "No records match your filter criteria."}}
+                )
+                return
+            header, rows = built
+            filename = _custom_report_filename(report_doc["name"], report_doc["createdAt"])
+            # Drain the encoder; it stores the file and marks the record Ready
+            for _ in _csv_report_chunks(header, rows, filename, report_doc):
+                pass
+        except Exception:
+            logger.exception("❌ Background report %s failed", report_id)
+            generated_reports_coll.update_one({"_id": report_id}, {"$set": {"status": "Failed"}})
+
+
+def _enqueue_custom_report(query, columns, report_name, data_source, user_id):
+    """Record a Pending custom report, hand it to the worker pool and return 202."""
+    error = _unknown_columns_response(columns)
+    if error:
+        return error
+    
+    report_doc = {
+        "userId": user_id,
+        "name": report_name,
+        "type": "CSV",
+        "status": "Pending",
+        "dataSource": data_source,
+        "query": query,
+        "columns": columns,
+        "createdAt": datetime.now(timezone.utc),
+        "isDeleted": False
+    }
+    report_id = generated_reports_coll.insert_one(report_doc).inserted_id
+    _report_executor.submit(
+        _build_custom_report, current_app._get_current_object(), report_id, report_doc
+    )
+    logger.info("⏳ Custom report %s queued for %s", report_id, user_id)
+    
+    return jsonify({
+        "success": True,
+        "message": f"Report '{report_name}' is being generated",
+        "reportId": str(report_id),
+        "status": "Pending"
+    }), 202
+
+
 @reports_bp.route("/hub/ai/summarize", methods=["POST"])
 @requires_auth()
 def generate_ai_summary():
@@ -1145,37 +1736,40 @@ def generate_ai_summary():
     try:
         caller_id = request.user_id
         caller_role = request.user_role
+        now = datetime.now(timezone.utc)
+        now_local = now.astimezone()
         body = request.get_json()
         
         query_text = body.get("query", "Summarize the validation data")
         data_scope = body.get("dataScope", "ideas")
         
-        logger.info(f"🤖 AI summary requested: {query_text}")
-        
-        mongo_query = build_role_based_query(caller_id, caller_role, data_scope)
+        logger.info("🤖 AI summary requested: %s", query_text)
         
-        ideas = list(ideas_coll.find(mongo_query).sort("overallScore", -1).limit(50))
+        # Overview, domain histogram and top 5 are computed server-side
+        stats = next(role_scoped_aggregate(
+            caller_id, caller_role, data_scope, _summary_stats_pipeline()
+        ), None)
         
-        if not ideas:
+        if not stats or not stats["overview"]:
             return jsonify({
                 "error": "No data available",
                 "message": "No ideas found for your role to generate a summary."
             }), 404
         
         # Generate summary (TODO: Integrate OpenAI)
-        summary = _generate_fallback_summary(ideas, query_text, caller_role)
+        summary = _generate_fallback_summary(stats, query_text, caller_role, now_local)
         
         # Save report
-        report_id = f"REP-AI-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+        report_id = f"REP-AI-{now.strftime('%Y%m%d%H%M%S')}"
         report_doc = {
             "_id": report_id,
             "userId": caller_id,
-            "name": f"AI Summary - {datetime.now().strftime('%Y-%m-%d')}",
+            "name": f"AI Summary - {now_local.strftime('%Y-%m-%d')}",
             "type": "AI",
             "summary": summary,
             "query": query_text,
-            "recordCount": len(ideas),
-            "createdAt": datetime.now(timezone.utc),
+            "recordCount": stats["overview"][0]["total"],
+            "createdAt": now,
             "status": "Ready",
             "isDeleted": False
         }
@@ -1189,34 +1783,96 @@ def generate_ai_summary():
                 "id": report_id,
                 "name": report_doc["name"],
                 "type": "AI",
-                "date": datetime.now().strftime("%Y-%m-%d"),
+                "date": now_local.strftime("%Y-%m-%d"),
                 "status": "Ready"
             }
         }), 200
         
+    except ExecutionTimeout:
+        logger.warning("⏱️ generate_ai_summary exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        logger.error(f"❌ AI summary failed: {e}")
+        logger.error("❌ AI summary failed: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
-def _generate_fallback_summary(ideas, user_query, role):
-    """Generate basic summary without OpenAI"""
-    total = len(ideas)
-    avg_score = sum(idea.get("overallScore", 0) for idea in ideas if idea.get("overallScore")) / total if total > 0 else 0
+def _summary_stats_pipeline(sample_size=50):
+    """
+    Aggregation stages computing the fallback-summary figures over the top
+    `sample_size` role-scoped ideas (by overallScore).
     
-    domains = {}
-    for idea in ideas:
-        domain = idea.get("domain", "Unknown")
-        domains[domain] = domains.get(domain, 0) + 1
+    Returns a single document:
+        overview: [{total, scoreSum, high, low}]
+        domains:  [{_id: domain, count}]  (top 3)
+        top:      [{title, overallScore, domain, stage}]  (top 5)
+    """
+    score = {"$ifNull": ["$overallScore", 0]}
+    return [
+        {"$sort": {"overallScore": -1}},
+        {"$limit": sample_size},
+        {"$facet": {
+            "overview": [
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": 1},
+                    "scoreSum": {"$sum": score},
+                    "high": {"$sum": {"$cond": [{"$gte": [score, 80]}, 1, 0]}},
+                    "low": {"$sum": {"$cond": [{"$lt": [score, 60]}, 1, 0]}}
+                }}
+            ],
+            "domains": [
+                {"$group": {"_id": {"$ifNull": ["$domain", "Unknown"]}, "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": 3}
+            ],
+            "top": [
+                {"$sort": {"overallScore": -1}},
+                {"$limit": 5},
+                {"$project": {"_id": 0, "title": 1, "overallScore": 1, "domain": 1, "stage": 1}}
+            ]
+        }}
+    ]
+
+
+# Static tail of the fallback summary
+_RECOMMENDATIONS_MD = """## 💡 Recommendations
+
+1. **Focus on High Performers**: Prioritize resources for ideas scoring above 80
+2. **Domain Concentration**: Consider diversifying or deepening focus based on distribution
+3. **Mentoring Support**: Provide additional guidance for ideas scoring below 60
+4. **Cross-domain Collaboration**: Explore partnerships across different domains
+
+---
+
+*Note: This is a basic summary. For AI-powered insights, configure OpenAI API key.*
+"""
+_RECOMMENDATIONS_MD_BYTES = _RECOMMENDATIONS_MD.encode("utf-8")
+
+
+def _summary_markdown_bytes(summary):
+    """UTF-8 body for a stored summary, reusing the pre-encoded static tail."""
+    if summary.endswith(_RECOMMENDATIONS_MD):
+        return summary[:-len(_RECOMMENDATIONS_MD)].encode("utf-8") + _RECOMMENDATIONS_MD_BYTES
+    return summary.encode("utf-8")
+
+
+def _generate_fallback_summary(stats, user_query, role, generated_at):
+    """Generate basic summary without OpenAI.
     
-    top_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)[:3]
-    high_performers = [idea for idea in ideas if idea.get("overallScore", 0) >= 80]
+    `stats` is the document produced by _summary_stats_pipeline().
+    """
+    overview = stats["overview"][0]
+    total = overview["total"]
+    avg_score = overview["scoreSum"] / total if total > 0 else 0
+    high_count = overview["high"]
+    low_count = overview["low"]
+    top_domains = [(d["_id"], d["count"]) for d in stats["domains"]]
     
-    summary = f"""# Validation Data Summary
+    parts = [f"""# Validation Data Summary
 
 **Generated for**: {role.replace('_', ' ').title()}  
 **Query**: "{user_query}"  
-**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Date**: {generated_at.strftime('%Y-%m-%d %H:%M')}
 
 ---
 
@@ -1224,36 +1880,36 @@ def _generate_fallback_summary(ideas, user_query, role):
 
 - **Total Ideas Analyzed**: {total}
 - **Average Validation Score**: {avg_score:.1f}/100
-- **High Performers (≥80)**: {len(high_performers)} ideas
-- **Needs Improvement (<60)**: {sum(1 for idea in ideas if idea.get("overallScore", 0) < 60)} ideas
+- **High Performers (≥80)**: {high_count} ideas
+- **Needs Improvement (<60)**: {low_count} ideas
 
 ## 🎯 Domain Distribution
 
-"""
+"""]
     
     for domain, count in top_domains:
-        summary += f"- **{domain}**: {count} ideas ({count/total*100:.1f}%)\n"
+        parts.append(f"- **{domain}**: {count} ideas ({count/total*100:.1f}%)\n")
     
-    summary += "\n## ⭐ Top 5 Ideas\n\n"
+    parts.append("\n## ⭐ Top 5 Ideas\n\n")
     
-    for i, idea in enumerate(sorted(ideas, key=lambda x: x.get("overallScore", 0), reverse=True)[:5], 1):
-        summary += f"{i}. **{idea.get('title', 'Untitled')}** - Score: {idea.get('overallScore', 'N/A')}/100\n"
-        summary += f"   - Domain: {idea.get('domain', 'N/A')}\n"
-        summary += f"   - Stage: {idea.get('stage', 'N/A')}\n\n"
+    for i, idea in enumerate(stats["top"], 1):
+        parts.append(
+            f"{i}. **{idea.get('title', 'Untitled')}** - Score: {idea.get('overallScore', 'N/A')}/100\n"
+            f"   - Domain: {idea.get('domain', 'N/A')}\n"
+            f"   - Stage: {idea.get('stage', 'N/A')}\n\n"
+        )
     
-    summary += """## 💡 Recommendations
-
-1. **Focus on High Performers**: Prioritize resources for ideas scoring above 80
-2. **Domain Concentration**: Consider diversifying or deepening focus based on distribution
-3. **Mentoring Support**: Provide additional guidance for ideas scoring below 60
-4. **Cross-domain Collaboration**: Explore partnerships across different domains
+    parts.append(_RECOMMENDATIONS_MD)
+    
+    return "".join(parts)
 
----
 
-*Note: This is a basic summary. For AI-powered insights, configure OpenAI API key.*
-"""
-    
-    return summary
+def _hub_report_id(report_id):
+    """
+    generated_reports _id for a route id: exports have ObjectIds, AI
+    summaries keep their "REP-AI-..." string ids.
+    """
+    return ObjectId(report_id) if is_oid_hex(report_id) else report_id
 
 
 @reports_bp.route("/hub/<report_id>", methods=["DELETE"])
@@ -1263,23 +1919,46 @@ def delete_hub_report(report_id):
     try:
         caller_id = request.user_id
         
-        result = generated_reports_coll.update_one(
-            {"_id": report_id, "userId": caller_id},
-            {"$set": {"isDeleted": True, "deletedAt": datetime.now(timezone.utc)}}
+        # One round trip that both soft-deletes and returns the final state
+        report = generated_reports_coll.find_one_and_update(
+            {"_id": _hub_report_id(report_id), "userId": caller_id, "isDeleted": {"$in": [False, None]}},
+            {"$set": {"isDeleted": True, "deletedAt": datetime.now(timezone.utc)}},
+            projection={"_id": 1, "deletedAt": 1},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.matched_count == 0:
+        if report is None:
             return jsonify({"error": "Report not found or access denied"}), 404
         
         return jsonify({
             "success": True,
-            "message": "Report deleted successfully"
+            "message": "Report deleted successfully",
+            "deletedAt": report["deletedAt"].isoformat()
         }), 200
         
     except Exception as e:
-        logger.error(f"❌ Failed to delete report: {e}")
+        logger.error("❌ Failed to delete report: %s", e)
         return jsonify({"error": str(e)}), 500
 
+# generated_reports fields the download route dispatches on
+_HUB_DOWNLOAD_PROJ = {
+    "status": 1, "type": 1, "name": 1, "createdAt": 1, "filePath": 1, "fileName": 1,
+    "query": 1, "columns": 1, "dataSource": 1, "summary": 1
+}
+
+
+def _local_report_path(file_path):
+    """
+    Path of a stored report relative to REPORTS_DIR, or None when no reports
+    directory is configured or the file lies outside it.
+    """
+    reports_dir = current_app.config.get("REPORTS_DIR")
+    if not reports_dir:
+        return None
+    rel = os.path.relpath(os.path.realpath(file_path), os.path.realpath(reports_dir))
+    return None if rel == os.pardir or rel.startswith(os.pardir + os.sep) else rel
+
+
 @reports_bp.route("/hub/<report_id>/download", methods=["GET"])
 @requires_auth()
 def download_generated_report(report_id):
@@ -1289,26 +1968,38 @@ def download_generated_report(report_id):
     try:
         caller_id = request.user_id
         
-        # Find the report
-        report = generated_reports_coll.find_one({
-            "_id": report_id,
+        # Find the report. Only a Ready report is read in full; a poll on a
+        # pending one falls through to a status-only lookup
+        report_filter = {
+            "_id": _hub_report_id(report_id),
             "userId": caller_id,
-            "isDeleted": {"$ne": True}
-        })
+            "isDeleted": {"$in": [False, None]}
+        }
+        report = generated_reports_coll.find_one(
+            {**report_filter, "status": "Ready"}, _HUB_DOWNLOAD_PROJ
+        )
         
         if not report:
+            if generated_reports_coll.find_one(report_filter, {"_id": 1}):
+                return jsonify({"error": "Report is not ready for download"}), 400
             return jsonify({"error": "Report not found or access denied"}), 404
         
-        if report.get("status") != "Ready":
-            return jsonify({"error": "Report is not ready for download"}), 400
-        
         # Check if report has stored file path or needs regeneration
-        if report.get("filePath"):
-            # If file is stored in S3 or local storage
-            return send_file(
-                report["filePath"],
+        file_path = report.get("filePath")
+        if file_path and file_path.startswith("s3://"):
+            # Stored at generation time - hand out a short-lived link
+            key = file_path[len("s3://"):].split("/", 1)[1]
+            return redirect(_get_s3_service().generate_presigned_url(key, expiration=900))
+        elif file_path and (local_path := _local_report_path(file_path)):
+            # Conditional response: Range requests resume interrupted
+            # downloads and If-None-Match revalidates without a re-send
+            return send_from_directory(
+                current_app.config["REPORTS_DIR"],
+                local_path,
                 as_attachment=True,
-                download_name=report.get("fileName", "report.csv")
+                download_name=report.get("fileName", "report.csv"),
+                conditional=True,
+                max_age=0
             )
         else:
             # Report needs to be regenerated
@@ -1316,21 +2007,51 @@ def download_generated_report(report_id):
             report_type = report.get("type", "CSV")
             
             if report_type == "CSV":
-                # Regenerate CSV from stored query
-                query = report.get("query", {})
+                # Only custom reports record the role-scoped query they were
+                # built from; standard exports (ideas summary, consultations)
+                # cannot be rebuilt here and must be exported again
+                if "query" not in report:
+                    return jsonify({
+                        "error": "Report file unavailable",
+                        "message": "This report's file is no longer available. Please export it again."
+                    }), 410
+                
+                # Regenerate CSV from stored query, streaming it straight
+                # from the cursor. The file is stored against this same
+                # record, so later downloads skip the rebuild.
                 columns = report.get("columns", [])
-                data_source = report.get("dataSource", "ideas")
+                error = _unknown_columns_response(columns)
+                if error:
+                    return error
+                
+                built = _custom_report_rows(report["query"], columns)
+                if built is None:
+                    return jsonify({
+                        "error": "No data found",
+                        "message": "No records match this report's filter criteria anymore."
+                    }), 404
+                header, rows = built
                 
-                return _generate_csv_custom(
-                    query, 
-                    columns, 
-                    report.get("name"), 
-                    data_source, 
-                    caller_id
+                filename = report.get("fileName") or _custom_report_filename(
+                    report.get("name") or "report", report.get("createdAt") or datetime.now(timezone.utc)
+                )
+                return _stream_csv_report(
+                    header, rows, filename, {"_id": report["_id"], "userId": caller_id}
+                )
+            elif report_type == "AI":
+                # Stored summary as a Markdown file; a bytes body carries
+                # its Content-Length instead of being chunked
+                body = _summary_markdown_bytes(report.get("summary", ""))
+                filename = f"{(report.get('name') or 'AI Summary').replace(' ', '_')}.md"
+                return set_attachment(
+                    Response(body, mimetype="text/markdown; charset=utf-8"), filename
                 )
             else:
                 return jsonify({"error": "Unsupported report type"}), 400
                 
+    except ExecutionTimeout:
+        logger.warning("⏱️ download_generated_report exceeded %sms", HUB_QUERY_MAX_TIME_MS)
+        return _hub_timeout_response()
     except Exception as e:
-        logger.error(f"❌ Failed to download report: {e}")
+        logger.error("❌ Failed to download report: %s", e)
         return jsonify({"error": str(e)}), 500
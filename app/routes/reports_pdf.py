@@ -5,14 +5,23 @@ Engine: Playwright (Chromium)
 Features: CSS Grid, Flexbox, Shadows, Gradients, High-DPI rendering.
 """
 
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, Response, request, jsonify
 from app.middleware.auth import requires_auth
-from app.database.mongo import results_coll, ideas_coll, generated_reports_coll, users_coll
+from app.database.mongo import results_coll, ideas_coll, generated_reports_coll
 from app.utils.validators import parse_oid
 from app.utils.id_helpers import ids_match
+from app.utils.downloads import set_attachment
+from bson import decode as bson_decode
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import io
+from jinja2 import Environment
+from markupsafe import escape
 import logging
+import os
+import threading
 
 # Playwright Import
 try:
@@ -28,401 +37,365 @@ reports_pdf_bp = Blueprint("reports_pdf", __name__, url_prefix="/api/reports")
 
 # ---------------------------- Helpers ----------------------------
 
-def safe_get(data, *keys, default=""):
-    result = data
-    for key in keys:
-        if isinstance(result, dict):
-            result = result.get(key, {})
-        else:
-            return default
-    return result if result not in (None, {}, []) else default
+_RISK_COLORS = {
+    "CRITICAL": "#dc2626",
+    "HIGH": "#ef4444",
+    "MEDIUM": "#f59e0b",
+    "LOW": "#16a34a",
+}
 
 def get_risk_color(severity):
-    s = str(severity or "").upper()
-    if s == "CRITICAL": return "#dc2626"
-    if s == "HIGH": return "#ef4444"
-    if s == "MEDIUM": return "#f59e0b"
-    if s == "LOW": return "#16a34a"
-    return "#6b7280"
-
-def render_list(items):
-    if not items: return ""
-    lis = "".join(f"<li>{item}</li>" for item in items)
-    return f"<ul>{lis}</ul>"
+    return _RISK_COLORS.get(str(severity or "").upper(), "#6b7280")
+
+# Infographic PDFs are limited to PDF_MONTHLY_LIMIT distinct ideas per
+# college per month. Ideas already counted are remembered per process as
+# (collegeId, month start) -> frozenset of str ideaIds. Within a month the
+# set only grows, so "idea already counted" and "limit already reached"
+# can be answered from it; anything else is rechecked against Mongo.
+PDF_MONTHLY_LIMIT = 10
+_pdf_usage_cache = {}
+_pdf_usage_lock = threading.Lock()
+
+
+def _month_start(now):
+    return datetime(now.year, now.month, 1, tzinfo=timezone.utc)
+
+
+def _remember_pdf_usage(key, idea_ids):
+    """Merge idea_ids into the cached set for key; drops earlier months."""
+    with _pdf_usage_lock:
+        for stale in [k for k in _pdf_usage_cache if k[1] != key[1]]:
+            del _pdf_usage_cache[stale]
+        _pdf_usage_cache[key] = _pdf_usage_cache.get(key, frozenset()) | frozenset(idea_ids)
 
 # ---------------------------- HTML Builders ----------------------------
+# Section markup lives in Jinja templates compiled once at import; the
+# builders only pick the data out of the stored analysis JSON. Analysis
+# fields are model output and are escaped on render.
 
-def build_business_case_html(bc):
-    if not isinstance(bc, dict) or not bc:
-        return '<div class="empty-state">Business case data not available.</div>'
+_jinja = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
 
-    title = bc.get("title", "Business Case")
-    exec_summary = bc.get("executiveSummary", "")
+_MACROS_SRC = """
+{% macro render_list(items) %}{% if items %}<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul>{% endif %}{% endmacro %}
+"""
 
-    # Data Extraction
-    big_idea = bc.get("theBigIdea", {})
-    solution = big_idea.get("solution", {})
-    customer = bc.get("theCustomer", {})
-    magic = bc.get("theMagic", {})
-    biz_model = bc.get("businessModel", {})
-    path = bc.get("pathForward", {})
-    
-    html = []
-
-    # Section Header
-    html.append(f"""
-    <div class="section-header border-blue">
-        <h2 class="text-blue">01. Business Case</h2>
-        <div class="sub-title">{title}</div>
-    </div>
-    """)
-
-    # Exec Summary
-    html.append(f"""
-    <div class="card bg-blue-light mb-4">
-        <h4 class="text-blue uppercase">Executive Summary</h4>
-        <p>{exec_summary}</p>
-    </div>
-    """)
-
-    # Grid: Problem & Mission
-    html.append(f"""
-    <div class="grid-2 mb-4">
-        <div class="card">
-            <h4 class="text-blue uppercase">The Problem</h4>
-            <p>{big_idea.get('problem', '')}</p>
-        </div>
-        <div class="card">
-            <h4 class="text-blue uppercase">The Mission</h4>
-            <p>{big_idea.get('mission', '')}</p>
-        </div>
+_BC_SRC = _MACROS_SRC + """
+<div class="section-header border-blue">
+    <h2 class="text-blue">01. Business Case</h2>
+    <div class="sub-title">{{ title }}</div>
+</div>
+
+<div class="card bg-blue-light mb-4">
+    <h4 class="text-blue uppercase">Executive Summary</h4>
+    <p>{{ exec_summary }}</p>
+</div>
+
+<div class="grid-2 mb-4">
+    <div class="card">
+        <h4 class="text-blue uppercase">The Problem</h4>
+        <p>{{ big_idea.get('problem', '') }}</p>
     </div>
-    """)
-
-    # Solution & Features
-    html.append(f"""
-    <div class="card mb-4 shadow-hover">
-        <h4 class="text-blue uppercase">The Solution</h4>
-        <p class="mb-2">{solution.get('overview', '')}</p>
-        <div class="feature-chips">
-            <strong>Key Features:</strong>
-            {render_list(solution.get('keyFeatures', []))}
-        </div>
-        <div class="alert-box mt-3 border-blue">
-            <strong>💎 Value Proposition:</strong> {big_idea.get('valueProposition', '')}
-        </div>
+    <div class="card">
+        <h4 class="text-blue uppercase">The Mission</h4>
+        <p>{{ big_idea.get('mission', '') }}</p>
     </div>
-    """)
-
-    # Target Market
-    market = customer.get("targetMarket", [])
-    if market:
-        html.append('<h3 class="section-title">Target Market</h3>')
-        market_html = ""
-        for seg in market:
-            market_html += f"""
-            <div class="card mb-3 no-break">
-                <div class="flex-row justify-between mb-2">
-                    <strong class="text-lg">{seg.get('segment')}</strong>
-                </div>
-                <p>{seg.get('description')}</p>
-                <div class="grid-2 mt-2 text-sm bg-gray-50 p-2 rounded">
-                    <div><strong>😟 Pain Points:</strong><br>{seg.get('painPoints')}</div>
-                    <div><strong>✅ How We Help:</strong><br>{seg.get('howWeHelp')}</div>
-                </div>
-            </div>
-            """
-        html.append(market_html)
-
-    # Market Stats
-    html.append(f"""
-    <div class="grid-2 mb-4">
-        <div class="card bg-gray-50">
-            <h5 class="uppercase text-muted">Market Strategy</h5>
-            <p>{customer.get('marketStrategy', '')}</p>
-        </div>
-        <div class="card bg-gray-50">
-            <h5 class="uppercase text-muted">Market Size</h5>
-            <p class="text-xl font-bold text-blue">{customer.get('marketSize', '')}</p>
-        </div>
+</div>
+
+<div class="card mb-4 shadow-hover">
+    <h4 class="text-blue uppercase">The Solution</h4>
+    <p class="mb-2">{{ solution.get('overview', '') }}</p>
+    <div class="feature-chips">
+        <strong>Key Features:</strong>
+        {{ render_list(solution.get('keyFeatures', [])) }}
+    </div>
+    <div class="alert-box mt-3 border-blue">
+        <strong>💎 Value Proposition:</strong> {{ big_idea.get('valueProposition', '') }}
+    </div>
+</div>
+
+{% if market %}
+<h3 class="section-title">Target Market</h3>
+{% for seg in market %}
+<div class="card mb-3 no-break">
+    <div class="flex-row justify-between mb-2">
+        <strong class="text-lg">{{ seg.get('segment') }}</strong>
     </div>
-    """)
+    <p>{{ seg.get('description') }}</p>
+    <div class="grid-2 mt-2 text-sm bg-gray-50 p-2 rounded">
+        <div><strong>😟 Pain Points:</strong><br>{{ seg.get('painPoints') }}</div>
+        <div><strong>✅ How We Help:</strong><br>{{ seg.get('howWeHelp') }}</div>
+    </div>
+</div>
+{% endfor %}
+{% endif %}
+
+<div class="grid-2 mb-4">
+    <div class="card bg-gray-50">
+        <h5 class="uppercase text-muted">Market Strategy</h5>
+        <p>{{ customer.get('marketStrategy', '') }}</p>
+    </div>
+    <div class="card bg-gray-50">
+        <h5 class="uppercase text-muted">Market Size</h5>
+        <p class="text-xl font-bold text-blue">{{ customer.get('marketSize', '') }}</p>
+    </div>
+</div>
 
-    # Comparison
-    comp = magic.get("comparison", {})
-    html.append(f"""
-    <h3 class="section-title">Competitive Landscape</h3>
-    <div class="comparison-grid mb-4">
-        <div class="comp-col">
-            <div class="comp-header">Traditional Approach</div>
-            <div class="comp-body">{comp.get('traditionalApproach', '-')}</div>
+<h3 class="section-title">Competitive Landscape</h3>
+<div class="comparison-grid mb-4">
+    <div class="comp-col">
+        <div class="comp-header">Traditional Approach</div>
+        <div class="comp-body">{{ comp.get('traditionalApproach', '-') }}</div>
+    </div>
+    <div class="comp-col highlight">
+        <div class="comp-header">Our Approach</div>
+        <div class="comp-body">{{ comp.get('ourApproach', '-') }}</div>
+    </div>
+    <div class="comp-col">
+        <div class="comp-header">Why It Matters</div>
+        <div class="comp-body">{{ comp.get('whyItMatters', '-') }}</div>
+    </div>
+</div>
+
+<h3 class="section-title">Business Model</h3>
+<div class="card mb-4">
+    <div class="grid-3">
+        <div>
+            <h5 class="uppercase text-muted">Revenue Model</h5>
+            <p>{{ biz_model.get('revenueModel', '') }}</p>
         </div>
-        <div class="comp-col highlight">
-            <div class="comp-header">Our Approach</div>
-            <div class="comp-body">{comp.get('ourApproach', '-')}</div>
+        <div>
+            <h5 class="uppercase text-muted">Unit Economics</h5>
+            <p>{{ biz_model.get('unitEconomics', '') }}</p>
         </div>
-        <div class="comp-col">
-            <div class="comp-header">Why It Matters</div>
-            <div class="comp-body">{comp.get('whyItMatters', '-')}</div>
+        <div>
+            <h5 class="uppercase text-muted">Financial Outlook</h5>
+            <p>{{ biz_model.get('financialProjections', '') }}</p>
         </div>
     </div>
-    """)
+    <div class="mt-3 pt-3 border-t">
+        <strong>Revenue Streams:</strong>
+        <ul class="compact-list">
+            {% for s in biz_model.get('revenueStreams', []) %}<li><strong>{{ s.get('stream') }}:</strong> {{ s.get('description') }}</li>{% endfor %}
+        </ul>
+    </div>
+</div>
+"""
 
-    # Business Model
-    html.append(f"""
-    <h3 class="section-title">Business Model</h3>
-    <div class="card mb-4">
-        <div class="grid-3">
-            <div>
-                <h5 class="uppercase text-muted">Revenue Model</h5>
-                <p>{biz_model.get('revenueModel', '')}</p>
-            </div>
-            <div>
-                <h5 class="uppercase text-muted">Unit Economics</h5>
-                <p>{biz_model.get('unitEconomics', '')}</p>
-            </div>
-            <div>
-                <h5 class="uppercase text-muted">Financial Outlook</h5>
-                <p>{biz_model.get('financialProjections', '')}</p>
-            </div>
-        </div>
-        <div class="mt-3 pt-3 border-t">
-            <strong>Revenue Streams:</strong>
-            <ul class="compact-list">
-                {"".join(f"<li><strong>{s.get('stream')}:</strong> {s.get('description')}</li>" for s in biz_model.get('revenueStreams', []))}
-            </ul>
+_RA_SRC = """
+<div class="page-break"></div>
+<div class="section-header border-red">
+    <h2 class="text-red">02. Risk Assessment</h2>
+    <div class="sub-title">{{ title }}</div>
+</div>
+
+{% set level_color = risk_color(overall.get('level')) %}
+<div class="card bg-red-light mb-4">
+    <h4 class="text-red uppercase">Executive Summary</h4>
+    <p>{{ exec_summary }}</p>
+</div>
+
+<div class="card mb-4 flex-row items-center border-l-thick" style="border-left-color: {{ level_color }}">
+    <div class="mr-4">
+        <h5 class="uppercase text-muted mb-1">Overall Risk Level</h5>
+        <div class="text-2xl font-bold" style="color: {{ level_color }}">{{ overall.get('level', 'UNKNOWN') }}</div>
+    </div>
+    <div class="pl-4 border-l">
+        <p>{{ overall.get('explanation') }}</p>
+    </div>
+</div>
+
+{% if all_risks %}
+<h3 class="section-title">Detailed Risk Register</h3>
+{% for risk in all_risks %}
+{% set sev_color = risk_color(risk.get('severity')) %}
+<div class="card mb-3 no-break risk-card" style="border-top: 4px solid {{ sev_color }}">
+    <div class="flex-row justify-between mb-2">
+        <strong class="text-lg" style="color: {{ sev_color }}">{{ risk.get('name') }}</strong>
+        <span class="badge" style="background: {{ sev_color }}">{{ risk.get('severity') }}</span>
+    </div>
+    <p class="mb-2">{{ risk.get('description') }}</p>
+    <div class="metrics-row bg-gray-50 p-2 rounded flex-row justify-around mb-2">
+        <div><span class="label">Likelihood</span> <strong>{{ risk.get('likelihood') }}%</strong></div>
+        <div><span class="label">Impact</span> <strong>{{ risk.get('impact') }}%</strong></div>
+    </div>
+    <div class="text-sm">
+        <strong>🛡️ Mitigation:</strong> {{ risk.get('mitigation') }}
+        <br><span class="text-muted italic">Contingency: {{ risk.get('contingencyPlan') }}</span>
+    </div>
+</div>
+{% endfor %}
+{% endif %}
+
+{% if mitigation %}
+<h3 class="section-title">Mitigation Strategy</h3>
+{% for item in mitigation %}
+<div class="card mb-3 no-break border-l-thick border-red">
+    <div class="flex-row justify-between">
+        <strong>{{ item.get('area') }}</strong>
+        <div>
+            <span class="badge bg-red">Priority {{ item.get('priority') }}</span>
+            <span class="text-sm text-muted ml-2">{{ item.get('timeline') }}</span>
         </div>
     </div>
-    """)
+    <div class="mt-2 bg-gray-50 p-2 rounded text-sm">
+        <strong>Rationale:</strong> {{ item.get('rationale') }}
+    </div>
+    <ul class="compact-list mt-2">
+        {% for a in item.get('actions', []) %}<li>{{ a }}</li>{% endfor %}
+    </ul>
+</div>
+{% endfor %}
+{% endif %}
+"""
 
-    return "\n".join(html)
+_SG_SRC = """
+{% macro render_swot(items) %}{% if items %}{% for i in items %}<div class='mb-1'>• <strong>{{ i.get('name') or i.get('opportunity') or i.get('threat') }}</strong>: {{ i.get('description') }}</div>{% endfor %}{% else %}-{% endif %}{% endmacro %}
+<div class="page-break"></div>
+<div class="section-header border-green">
+    <h2 class="text-green">03. Strategic Growth</h2>
+    <div class="sub-title">{{ title }}</div>
+</div>
+
+<div class="card bg-green-light mb-4">
+    <h4 class="text-green uppercase">Executive Summary</h4>
+    <p>{{ exec_summary }}</p>
+</div>
+
+<div class="grid-3 mb-4">
+    <div class="card col-span-2">
+        <h4 class="text-green uppercase">Vision</h4>
+        <p>{{ vision.get('vision') }}</p>
+        <h4 class="text-green uppercase mt-2">Mission</h4>
+        <p>{{ vision.get('mission') }}</p>
+    </div>
+    <div class="card flex-col items-center justify-center bg-green-50">
+        <h5 class="uppercase text-muted">Current Status</h5>
+        <div class="text-4xl font-bold text-green my-2">TRL {{ vision.get('currentTRL') }}</div>
+        <span class="badge bg-green">{{ vision.get('currentPhase') }}</span>
+    </div>
+</div>
+
+<h3 class="section-title">SWOT Analysis</h3>
+<div class="swot-grid mb-4">
+    <div class="swot-box bg-green-50 border-green">
+        <h5 class="text-green">Strengths</h5>
+        {{ render_swot(swot.get('strengths', [])) }}
+    </div>
+    <div class="swot-box bg-red-50 border-red">
+        <h5 class="text-red">Weaknesses</h5>
+        {{ render_swot(swot.get('weaknesses', [])) }}
+    </div>
+    <div class="swot-box bg-blue-50 border-blue">
+        <h5 class="text-blue">Opportunities</h5>
+        {{ render_swot(swot.get('opportunities', [])) }}
+    </div>
+    <div class="swot-box bg-amber-50 border-amber">
+        <h5 class="text-amber">Threats</h5>
+        {{ render_swot(swot.get('threats', [])) }}
+    </div>
+</div>
+
+<h3 class="section-title">TRL Progression Roadmap</h3>
+{% for phase in phases %}
+<div class="timeline-card no-break">
+    <div class="timeline-header">
+        <strong>{{ phase.get('phaseName') }}</strong>
+        <span class="badge bg-green">{{ phase.get('status') }}</span>
+    </div>
+    <p class="mb-2"><strong>Objective:</strong> {{ phase.get('objectives') }}</p>
+    <div class="text-sm bg-gray-50 p-2 rounded">
+        <strong>Key Activities:</strong>
+        <ul class="compact-list">
+            {% for a in phase.get('keyActivities', []) %}<li>{{ a.get('activity') }} ({{ a.get('timeline') }})</li>{% endfor %}
+        </ul>
+    </div>
+</div>
+{% endfor %}
+
+<h3 class="section-title">Growth Horizons</h3>
+<div class="grid-3 mb-4">
+    <div class="card h-full">
+        <h5 class="text-green uppercase">Short Term</h5>
+        <div class="text-xs text-muted mb-2">0-6 Months</div>
+        <p class="text-sm">{{ short.get('focus') }}</p>
+    </div>
+    <div class="card h-full">
+        <h5 class="text-green uppercase">Medium Term</h5>
+        <div class="text-xs text-muted mb-2">6-18 Months</div>
+        <p class="text-sm">{{ medium.get('focus') }}</p>
+    </div>
+    <div class="card h-full">
+        <h5 class="text-green uppercase">Long Term</h5>
+        <div class="text-xs text-muted mb-2">18+ Months</div>
+        <p class="text-sm">{{ long_t.get('focus') }}</p>
+    </div>
+</div>
+"""
+
+_BC_TPL = _jinja.from_string(_BC_SRC)
+_RA_TPL = _jinja.from_string(_RA_SRC)
+_SG_TPL = _jinja.from_string(_SG_SRC)
+
+
+def build_business_case_html(bc):
+    if not isinstance(bc, dict) or not bc:
+        return '<div class="empty-state">Business case data not available.</div>'
+
+    big_idea = bc.get("theBigIdea", {})
+    customer = bc.get("theCustomer", {})
+    return _BC_TPL.render(
+        title=bc.get("title", "Business Case"),
+        exec_summary=bc.get("executiveSummary", ""),
+        big_idea=big_idea,
+        solution=big_idea.get("solution", {}),
+        customer=customer,
+        market=customer.get("targetMarket", []),
+        comp=bc.get("theMagic", {}).get("comparison", {}),
+        biz_model=bc.get("businessModel", {}),
+    )
 
 
 def build_risk_assessment_html(ra):
     if not isinstance(ra, dict) or not ra:
         return '<div class="empty-state">Risk data not available.</div>'
 
-    title = ra.get("title", "Risk Assessment")
-    exec_summary = ra.get("executiveSummary", "")
-    overall = ra.get("overallRiskProfile", {})
-    
     # Flatten Risks
-    cats = ra.get("riskCategories", {})
     all_risks = []
-    for key, val in cats.items():
+    for val in ra.get("riskCategories", {}).values():
         if isinstance(val, list): all_risks.extend(val)
 
-    mitigation = ra.get("prioritizedMitigation", [])
-
-    html = []
-
-    # Header
-    html.append(f"""
-    <div class="page-break"></div>
-    <div class="section-header border-red">
-        <h2 class="text-red">02. Risk Assessment</h2>
-        <div class="sub-title">{title}</div>
-    </div>
-    """)
-
-    # Exec Summary & Profile
-    level_color = get_risk_color(overall.get('level'))
-    html.append(f"""
-    <div class="card bg-red-light mb-4">
-        <h4 class="text-red uppercase">Executive Summary</h4>
-        <p>{exec_summary}</p>
-    </div>
-    
-    <div class="card mb-4 flex-row items-center border-l-thick" style="border-left-color: {level_color}">
-        <div class="mr-4">
-            <h5 class="uppercase text-muted mb-1">Overall Risk Level</h5>
-            <div class="text-2xl font-bold" style="color: {level_color}">{overall.get('level', 'UNKNOWN')}</div>
-        </div>
-        <div class="pl-4 border-l">
-            <p>{overall.get('explanation')}</p>
-        </div>
-    </div>
-    """)
-
-    # Detailed Risks
-    if all_risks:
-        html.append('<h3 class="section-title">Detailed Risk Register</h3>')
-        for risk in all_risks:
-            sev_color = get_risk_color(risk.get("severity"))
-            html.append(f"""
-            <div class="card mb-3 no-break risk-card" style="border-top: 4px solid {sev_color}">
-                <div class="flex-row justify-between mb-2">
-                    <strong class="text-lg" style="color: {sev_color}">{risk.get('name')}</strong>
-                    <span class="badge" style="background: {sev_color}">{risk.get('severity')}</span>
-                </div>
-                <p class="mb-2">{risk.get('description')}</p>
-                <div class="metrics-row bg-gray-50 p-2 rounded flex-row justify-around mb-2">
-                    <div><span class="label">Likelihood</span> <strong>{risk.get('likelihood')}%</strong></div>
-                    <div><span class="label">Impact</span> <strong>{risk.get('impact')}%</strong></div>
-                </div>
-                <div class="text-sm">
-                    <strong>🛡️ Mitigation:</strong> {risk.get('mitigation')}
-                    <br><span class="text-muted italic">Contingency: {risk.get('contingencyPlan')}</span>
-                </div>
-            </div>
-            """)
-
-    # Mitigation Plan
-    if mitigation:
-        html.append('<h3 class="section-title">Mitigation Strategy</h3>')
-        for item in mitigation:
-            html.append(f"""
-            <div class="card mb-3 no-break border-l-thick border-red">
-                <div class="flex-row justify-between">
-                    <strong>{item.get('area')}</strong>
-                    <div>
-                        <span class="badge bg-red">Priority {item.get('priority')}</span>
-                        <span class="text-sm text-muted ml-2">{item.get('timeline')}</span>
-                    </div>
-                </div>
-                <div class="mt-2 bg-gray-50 p-2 rounded text-sm">
-                    <strong>Rationale:</strong> {item.get('rationale')}
-                </div>
-                <ul class="compact-list mt-2">
-                    {"".join(f"<li>{a}</li>" for a in item.get('actions', []))}
-                </ul>
-            </div>
-            """)
-
-    return "\n".join(html)
+    return _RA_TPL.render(
+        title=ra.get("title", "Risk Assessment"),
+        exec_summary=ra.get("executiveSummary", ""),
+        overall=ra.get("overallRiskProfile", {}),
+        all_risks=all_risks,
+        mitigation=ra.get("prioritizedMitigation", []),
+        risk_color=get_risk_color,
+    )
 
 
 def build_strategic_growth_html(sg):
     if not isinstance(sg, dict) or not sg:
         return '<div class="empty-state">Growth data not available.</div>'
 
-    title = sg.get("title", "Strategic Growth")
-    exec_summary = sg.get("executiveSummary", "")
-    vision = sg.get("visionAndIntent", {})
-    swot = sg.get("swotAnalysis", {})
-    roadmap = sg.get("trlProgressionRoadmap", {})
-    phases = roadmap.get("phases", [])
     growth_strat = sg.get("growthStrategy", {})
-
-    html = []
-
-    # Header
-    html.append(f"""
-    <div class="page-break"></div>
-    <div class="section-header border-green">
-        <h2 class="text-green">03. Strategic Growth</h2>
-        <div class="sub-title">{title}</div>
-    </div>
-    """)
-
-    # Exec Summary & Vision
-    html.append(f"""
-    <div class="card bg-green-light mb-4">
-        <h4 class="text-green uppercase">Executive Summary</h4>
-        <p>{exec_summary}</p>
-    </div>
-
-    <div class="grid-3 mb-4">
-        <div class="card col-span-2">
-            <h4 class="text-green uppercase">Vision</h4>
-            <p>{vision.get('vision')}</p>
-            <h4 class="text-green uppercase mt-2">Mission</h4>
-            <p>{vision.get('mission')}</p>
-        </div>
-        <div class="card flex-col items-center justify-center bg-green-50">
-            <h5 class="uppercase text-muted">Current Status</h5>
-            <div class="text-4xl font-bold text-green my-2">TRL {vision.get('currentTRL')}</div>
-            <span class="badge bg-green">{vision.get('currentPhase')}</span>
-        </div>
-    </div>
-    """)
-
-    # SWOT (The Modern Grid)
-    def render_swot(items):
-        if not items: return "-"
-        return "".join(f"<div class='mb-1'>• <strong>{i.get('name') or i.get('opportunity') or i.get('threat')}</strong>: {i.get('description')}</div>" for i in items)
-
-    html.append(f"""
-    <h3 class="section-title">SWOT Analysis</h3>
-    <div class="swot-grid mb-4">
-        <div class="swot-box bg-green-50 border-green">
-            <h5 class="text-green">Strengths</h5>
-            {render_swot(swot.get('strengths', []))}
-        </div>
-        <div class="swot-box bg-red-50 border-red">
-            <h5 class="text-red">Weaknesses</h5>
-            {render_swot(swot.get('weaknesses', []))}
-        </div>
-        <div class="swot-box bg-blue-50 border-blue">
-            <h5 class="text-blue">Opportunities</h5>
-            {render_swot(swot.get('opportunities', []))}
-        </div>
-        <div class="swot-box bg-amber-50 border-amber">
-            <h5 class="text-amber">Threats</h5>
-            {render_swot(swot.get('threats', []))}
-        </div>
-    </div>
-    """)
-
-    # Roadmap
-    html.append('<h3 class="section-title">TRL Progression Roadmap</h3>')
-    for phase in phases:
-        html.append(f"""
-        <div class="timeline-card no-break">
-            <div class="timeline-header">
-                <strong>{phase.get('phaseName')}</strong>
-                <span class="badge bg-green">{phase.get('status')}</span>
-            </div>
-            <p class="mb-2"><strong>Objective:</strong> {phase.get('objectives')}</p>
-            <div class="text-sm bg-gray-50 p-2 rounded">
-                <strong>Key Activities:</strong>
-                <ul class="compact-list">
-                    {"".join(f"<li>{a.get('activity')} ({a.get('timeline')})</li>" for a in phase.get('keyActivities', []))}
-                </ul>
-            </div>
-        </div>
-        """)
-
-    # Growth Horizons
-    short = growth_strat.get("shortTerm", {})
-    medium = growth_strat.get("mediumTerm", {})
-    long_t = growth_strat.get("longTerm", {})
-    
-    html.append(f"""
-    <h3 class="section-title">Growth Horizons</h3>
-    <div class="grid-3 mb-4">
-        <div class="card h-full">
-            <h5 class="text-green uppercase">Short Term</h5>
-            <div class="text-xs text-muted mb-2">0-6 Months</div>
-            <p class="text-sm">{short.get('focus')}</p>
-        </div>
-        <div class="card h-full">
-            <h5 class="text-green uppercase">Medium Term</h5>
-            <div class="text-xs text-muted mb-2">6-18 Months</div>
-            <p class="text-sm">{medium.get('focus')}</p>
-        </div>
-        <div class="card h-full">
-            <h5 class="text-green uppercase">Long Term</h5>
-            <div class="text-xs text-muted mb-2">18+ Months</div>
-            <p class="text-sm">{long_t.get('focus')}</p>
-        </div>
-    </div>
-    """)
-
-    return "\n".join(html)
-
-
-def build_full_html(idea_title, overall_score, bc, ra, sg):
-    return f"""
-<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8" />
-<title>{idea_title}</title>
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap" rel="stylesheet">
-<style>
+    return _SG_TPL.render(
+        title=sg.get("title", "Strategic Growth"),
+        exec_summary=sg.get("executiveSummary", ""),
+        vision=sg.get("visionAndIntent", {}),
+        swot=sg.get("swotAnalysis", {}),
+        phases=sg.get("trlProgressionRoadmap", {}).get("phases", []),
+        short=growth_strat.get("shortTerm", {}),
+        medium=growth_strat.get("mediumTerm", {}),
+        long_t=growth_strat.get("longTerm", {}),
+    )
+
+
+# Infographic stylesheet; only the score ring depends on the report, and
+# build_full_html appends that rule after this block.
+_STATIC_CSS = """
     /* --- Modern CSS Reset & Variables --- */
-    :root {{
+    :root {
         --blue: #2563eb;
         --blue-light: #eff6ff;
         --red: #dc2626;
@@ -434,9 +407,9 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
         --gray-100: #f3f4f6;
         --text-main: #1f2937;
         --text-muted: #6b7280;
-    }}
+    }
     
-    body {{
+    body {
         font-family: 'Inter', sans-serif;
         color: var(--text-main);
         line-height: 1.5;
@@ -444,77 +417,76 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
         margin: 0;
         padding: 0;
         background: #fff;
-    }}
+    }
 
     /* --- Utilities --- */
-    .uppercase {{ text-transform: uppercase; letter-spacing: 0.05em; }}
-    .text-blue {{ color: var(--blue); }}
-    .text-red {{ color: var(--red); }}
-    .text-green {{ color: var(--green); }}
-    .text-amber {{ color: var(--amber); }}
-    .text-muted {{ color: var(--text-muted); }}
-    .bg-blue-light {{ background: var(--blue-light); }}
-    .bg-red-light {{ background: var(--red-light); }}
-    .bg-green-light {{ background: var(--green-light); }}
-    .bg-gray-50 {{ background: var(--gray-50); }}
+    .uppercase { text-transform: uppercase; letter-spacing: 0.05em; }
+    .text-blue { color: var(--blue); }
+    .text-red { color: var(--red); }
+    .text-green { color: var(--green); }
+    .text-amber { color: var(--amber); }
+    .text-muted { color: var(--text-muted); }
+    .bg-blue-light { background: var(--blue-light); }
+    .bg-red-light { background: var(--red-light); }
+    .bg-green-light { background: var(--green-light); }
+    .bg-gray-50 { background: var(--gray-50); }
     
-    .font-bold {{ font-weight: 700; }}
-    .text-xl {{ font-size: 1.25rem; }}
-    .text-2xl {{ font-size: 1.5rem; }}
-    .text-4xl {{ font-size: 2.25rem; }}
-    .text-lg {{ font-size: 1.125rem; }}
-    .text-sm {{ font-size: 0.875rem; }}
-    .text-xs {{ font-size: 0.75rem; }}
-
-    .mb-1 {{ margin-bottom: 0.25rem; }}
-    .mb-2 {{ margin-bottom: 0.5rem; }}
-    .mb-3 {{ margin-bottom: 0.75rem; }}
-    .mb-4 {{ margin-bottom: 1rem; }}
-    .mt-2 {{ margin-top: 0.5rem; }}
-    .mt-3 {{ margin-top: 0.75rem; }}
-    .ml-2 {{ margin-left: 0.5rem; }}
-    .mr-4 {{ margin-right: 1rem; }}
-    .p-2 {{ padding: 0.5rem; }}
-    .pt-3 {{ padding-top: 0.75rem; }}
+    .font-bold { font-weight: 700; }
+    .text-xl { font-size: 1.25rem; }
+    .text-2xl { font-size: 1.5rem; }
+    .text-4xl { font-size: 2.25rem; }
+    .text-lg { font-size: 1.125rem; }
+    .text-sm { font-size: 0.875rem; }
+    .text-xs { font-size: 0.75rem; }
+
+    .mb-1 { margin-bottom: 0.25rem; }
+    .mb-2 { margin-bottom: 0.5rem; }
+    .mb-3 { margin-bottom: 0.75rem; }
+    .mb-4 { margin-bottom: 1rem; }
+    .mt-2 { margin-top: 0.5rem; }
+    .mt-3 { margin-top: 0.75rem; }
+    .ml-2 { margin-left: 0.5rem; }
+    .mr-4 { margin-right: 1rem; }
+    .p-2 { padding: 0.5rem; }
+    .pt-3 { padding-top: 0.75rem; }
 
     /* --- Layouts (Grid/Flex) --- */
-    .grid-2 {{ display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }}
-    .grid-3 {{ display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 1rem; }}
-    .col-span-2 {{ grid-column: span 2; }}
+    .grid-2 { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }
+    .grid-3 { display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 1rem; }
+    .col-span-2 { grid-column: span 2; }
     
-    .flex-row {{ display: flex; flex-direction: row; }}
-    .flex-col {{ display: flex; flex-direction: column; }}
-    .justify-between {{ justify-content: space-between; }}
-    .justify-around {{ justify-content: space-around; }}
-    .items-center {{ align-items: center; }}
-    .justify-center {{ justify-content: center; }}
-    .h-full {{ height: 100%; }}
+    .flex-row { display: flex; flex-direction: row; }
+    .flex-col { display: flex; flex-direction: column; }
+    .justify-between { justify-content: space-between; }
+    .justify-around { justify-content: space-around; }
+    .items-center { align-items: center; }
+    .justify-center { justify-content: center; }
+    .h-full { height: 100%; }
 
     /* --- Components --- */
     
     /* Header */
-    .report-header {{
+    .report-header {
         display: flex;
         justify-content: space-between;
         align-items: center;
         border-bottom: 2px solid #e5e7eb;
         padding-bottom: 20px;
         margin-bottom: 30px;
-    }}
-    .report-title h1 {{ font-size: 2rem; font-weight: 800; margin: 0; color: #111; }}
-    .report-meta {{ font-size: 0.9rem; color: var(--text-muted); margin-top: 5px; }}
+    }
+    .report-title h1 { font-size: 2rem; font-weight: 800; margin: 0; color: #111; }
+    .report-meta { font-size: 0.9rem; color: var(--text-muted); margin-top: 5px; }
 
     /* Score Circle (Conic Gradient) */
-    .score-circle {{
+    .score-circle {
         width: 100px;
         height: 100px;
         border-radius: 50%;
-        background: conic-gradient(var(--blue) {overall_score}%, #e5e7eb 0);
         display: flex;
         align-items: center;
         justify-content: center;
-    }}
-    .score-inner {{
+    }
+    .score-inner {
         width: 85px;
         height: 85px;
         background: white;
@@ -523,43 +495,43 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
         flex-direction: column;
         align-items: center;
         justify-content: center;
-    }}
-    .score-num {{ font-size: 1.8rem; font-weight: 800; line-height: 1; }}
-    .score-label {{ font-size: 0.7rem; text-transform: uppercase; color: var(--text-muted); font-weight: 700; }}
+    }
+    .score-num { font-size: 1.8rem; font-weight: 800; line-height: 1; }
+    .score-label { font-size: 0.7rem; text-transform: uppercase; color: var(--text-muted); font-weight: 700; }
 
     /* Section Headers */
-    .section-header {{ margin-bottom: 1.5rem; padding-left: 1rem; }}
-    .section-header h2 {{ font-size: 1.5rem; margin: 0; font-weight: 800; }}
-    .sub-title {{ font-size: 1rem; color: var(--text-muted); }}
-    .border-blue {{ border-left: 5px solid var(--blue); }}
-    .border-red {{ border-left: 5px solid var(--red); }}
-    .border-green {{ border-left: 5px solid var(--green); }}
+    .section-header { margin-bottom: 1.5rem; padding-left: 1rem; }
+    .section-header h2 { font-size: 1.5rem; margin: 0; font-weight: 800; }
+    .sub-title { font-size: 1rem; color: var(--text-muted); }
+    .border-blue { border-left: 5px solid var(--blue); }
+    .border-red { border-left: 5px solid var(--red); }
+    .border-green { border-left: 5px solid var(--green); }
 
     /* Titles */
-    .section-title {{
+    .section-title {
         font-size: 1.1rem;
         font-weight: 700;
         margin: 1.5rem 0 1rem 0;
         padding-bottom: 0.5rem;
         border-bottom: 1px solid #e5e7eb;
         color: #374151;
-    }}
+    }
     
     /* Cards */
-    .card {{
+    .card {
         background: white;
         border: 1px solid #e5e7eb;
         border-radius: 8px;
         padding: 1.25rem;
         box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    }}
-    .shadow-hover {{ box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1); }}
+    }
+    .shadow-hover { box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1); }
     
-    h4 {{ margin: 0 0 0.5rem 0; font-size: 0.9rem; font-weight: 700; }}
-    h5 {{ margin: 0 0 0.5rem 0; font-size: 0.75rem; font-weight: 700; letter-spacing: 0.05em; }}
+    h4 { margin: 0 0 0.5rem 0; font-size: 0.9rem; font-weight: 700; }
+    h5 { margin: 0 0 0.5rem 0; font-size: 0.75rem; font-weight: 700; letter-spacing: 0.05em; }
 
     /* Badges & Chips */
-    .badge {{
+    .badge {
         display: inline-block;
         padding: 0.25rem 0.75rem;
         border-radius: 9999px;
@@ -567,48 +539,48 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
         font-weight: 600;
         color: white;
         background: var(--text-muted);
-    }}
-    .bg-red {{ background: var(--red); }}
-    .bg-green {{ background: var(--green); }}
+    }
+    .bg-red { background: var(--red); }
+    .bg-green { background: var(--green); }
 
-    .feature-chips ul {{ list-style: none; padding: 0; display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem; }}
-    .feature-chips li {{ background: var(--gray-100); padding: 0.25rem 0.75rem; border-radius: 9999px; font-size: 0.8rem; border: 1px solid #e5e7eb; }}
+    .feature-chips ul { list-style: none; padding: 0; display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem; }
+    .feature-chips li { background: var(--gray-100); padding: 0.25rem 0.75rem; border-radius: 9999px; font-size: 0.8rem; border: 1px solid #e5e7eb; }
 
     /* Specific Elements */
-    .alert-box {{ background: var(--blue-light); padding: 10px; border-radius: 6px; font-size: 0.9rem; }}
-    .border-t {{ border-top: 1px solid #e5e7eb; }}
-    .border-l {{ border-left: 1px solid #e5e7eb; }}
-    .border-l-thick {{ border-left-width: 4px; border-left-style: solid; }}
-    .rounded {{ border-radius: 6px; }}
-    .compact-list {{ margin: 0; padding-left: 1.2rem; }}
-    .compact-list li {{ margin-bottom: 0.2rem; }}
+    .alert-box { background: var(--blue-light); padding: 10px; border-radius: 6px; font-size: 0.9rem; }
+    .border-t { border-top: 1px solid #e5e7eb; }
+    .border-l { border-left: 1px solid #e5e7eb; }
+    .border-l-thick { border-left-width: 4px; border-left-style: solid; }
+    .rounded { border-radius: 6px; }
+    .compact-list { margin: 0; padding-left: 1.2rem; }
+    .compact-list li { margin-bottom: 0.2rem; }
 
     /* Comparison Table (Grid) */
-    .comparison-grid {{ display: grid; grid-template-columns: 1fr 1fr 1fr; border: 1px solid #e5e7eb; border-radius: 8px; overflow: hidden; }}
-    .comp-col {{ padding: 1rem; border-right: 1px solid #e5e7eb; }}
-    .comp-col:last-child {{ border-right: none; }}
-    .comp-col.highlight {{ background: var(--blue-light); }}
-    .comp-header {{ font-weight: 700; margin-bottom: 0.5rem; font-size: 0.9rem; color: var(--text-muted); text-transform: uppercase; }}
-    .comp-body {{ font-size: 0.9rem; }}
+    .comparison-grid { display: grid; grid-template-columns: 1fr 1fr 1fr; border: 1px solid #e5e7eb; border-radius: 8px; overflow: hidden; }
+    .comp-col { padding: 1rem; border-right: 1px solid #e5e7eb; }
+    .comp-col:last-child { border-right: none; }
+    .comp-col.highlight { background: var(--blue-light); }
+    .comp-header { font-weight: 700; margin-bottom: 0.5rem; font-size: 0.9rem; color: var(--text-muted); text-transform: uppercase; }
+    .comp-body { font-size: 0.9rem; }
 
     /* SWOT Grid */
-    .swot-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }}
-    .swot-box {{ padding: 1rem; border-radius: 8px; border-top-width: 4px; border-top-style: solid; }}
-    .border-amber {{ border-color: var(--amber); }}
-    .text-amber {{ color: var(--amber); }}
-    .bg-amber-50 {{ background: #fffbeb; }}
-    .bg-blue-50 {{ background: #eff6ff; }}
-    .bg-red-50 {{ background: #fef2f2; }}
-    .bg-green-50 {{ background: #f0fdf4; }}
+    .swot-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }
+    .swot-box { padding: 1rem; border-radius: 8px; border-top-width: 4px; border-top-style: solid; }
+    .border-amber { border-color: var(--amber); }
+    .text-amber { color: var(--amber); }
+    .bg-amber-50 { background: #fffbeb; }
+    .bg-blue-50 { background: #eff6ff; }
+    .bg-red-50 { background: #fef2f2; }
+    .bg-green-50 { background: #f0fdf4; }
 
     /* Timeline */
-    .timeline-card {{ 
+    .timeline-card { 
         border-left: 2px solid #e5e7eb; 
         padding-left: 1.5rem; 
         position: relative; 
         margin-bottom: 1.5rem; 
-    }}
-    .timeline-card::before {{
+    }
+    .timeline-card::before {
         content: '';
         position: absolute;
         left: -6px;
@@ -618,22 +590,57 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
         border-radius: 50%;
         background: var(--green);
         border: 2px solid white;
-    }}
-    .timeline-header {{ display: flex; justify-content: space-between; margin-bottom: 0.5rem; }}
+    }
+    .timeline-header { display: flex; justify-content: space-between; margin-bottom: 0.5rem; }
 
     /* Label Pill */
-    .label {{
+    .label {
         text-transform: uppercase;
         font-size: 0.65rem;
         font-weight: 700;
         color: var(--text-muted);
         letter-spacing: 0.05em;
-    }}
+    }
 
     /* Print Controls */
-    .page-break {{ page-break-before: always; }}
-    .no-break {{ page-break-inside: avoid; }}
+    .page-break { page-break-before: always; }
+    .no-break { page-break-inside: avoid; }
+
+    /* Page footer, drawn by Chromium's paged media rather than a footer template
+       (margin boxes need Chromium 131+, bundled from playwright 1.49) */
+    @page {
+        margin: 20mm;
+        @bottom-center {
+            content: "Pragati Innovation Platform  |  Confidential Report";
+            white-space: pre;
+            font-family: sans-serif;
+            font-size: 10px;
+            color: #9ca3af;
+            border-top: 1px solid #e5e7eb;
+        }
+        @bottom-right {
+            content: "Page " counter(page) " of " counter(pages);
+            font-family: sans-serif;
+            font-size: 10px;
+            color: #9ca3af;
+            border-top: 1px solid #e5e7eb;
+        }
+    }
+"""
+
 
+def build_full_html(idea_title, overall_score, bc, ra, sg):
+    idea_title = escape(idea_title)
+    return f"""
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8" />
+<title>{idea_title}</title>
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap" rel="stylesheet">
+<style>
+{_STATIC_CSS}    .score-circle {{ background: conic-gradient(var(--blue) {overall_score}%, #e5e7eb 0); }}
 </style>
 </head>
 <body>
@@ -660,60 +667,232 @@ def build_full_html(idea_title, overall_score, bc, ra, sg):
 </html>
 """
 
-# ---------------------------- Routes ----------------------------
-
-@reports_pdf_bp.route("/<report_id>/infographic-pdf", methods=["GET"])
-@requires_auth()
-def download_infographic_pdf(report_id):
+# ---------------------------- PDF Rendering ----------------------------
+
+# Playwright's sync API is bound to the thread that started it, so each
+# render thread owns its own Chromium and requests hand the pool jobs.
+# Browsers are launched once per thread and reused; each PDF gets a fresh
+# context. Concurrent PDFs render in parallel, one renderer process each.
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+_pdf_executor = ThreadPoolExecutor(max_workers=PDF_RENDER_WORKERS, thread_name_prefix="pdf-render")
+_renderer = threading.local()
+# Render threads that have started a Playwright driver
+_renderer_threads = set()
+_renderer_threads_lock = threading.Lock()
+
+
+def _get_browser():
+    """The render thread's browser, (re)launched if it isn't running."""
+    browser = getattr(_renderer, "browser", None)
+    if browser is None or not browser.is_connected():
+        if getattr(_renderer, "playwright", None) is None:
+            _renderer.playwright = sync_playwright().start()
+            with _renderer_threads_lock:
+                _renderer_threads.add(threading.get_ident())
+        browser = _renderer.playwright.chromium.launch(
+            headless=True,
+            args=["--no-sandbox", "--disable-dev-shm-usage", "--font-render-hinting=none"]
+        )
+        _renderer.browser = browser
+        logger.info("🧭 Launched Chromium for PDF rendering")
+    return browser
+
+
+def _get_context():
+    """
+    The render thread's browser context. It outlives a single render so
+    Chromium's HTTP cache keeps the web font and its stylesheet between
+    PDFs; each render still gets a fresh page.
+    """
+    browser = _get_browser()
+    context = getattr(_renderer, "context", None)
+    if context is None or getattr(_renderer, "context_browser", None) is not browser:
+        context = browser.new_context()
+        _renderer.context = context
+        _renderer.context_browser = browser
+    return context
+
+
+def _render_pdf(html_content):
+    page = _get_context().new_page()
     try:
-        # 1. Validation & Data Fetching
-        oid = parse_oid(report_id)
-        if not oid: return jsonify({"error": "Invalid report ID"}), 400
+        # Load HTML content. "load" covers the stylesheet; fonts.ready then
+        # waits for the web fonts it pulls in, without networkidle's fixed
+        # 500ms idle window
+        page.set_content(html_content, wait_until="load")
+        page.evaluate("document.fonts.ready")
+        
+        # Create PDF
+        pdf_bytes = page.pdf(
+            format="A4",
+            print_background=True, # Essential for colors/shadows
+            margin={
+                "top": "20mm",
+                "right": "20mm",
+                "bottom": "20mm",
+                "left": "20mm"
+            },
+            # Footer comes from the document's @page rules
+            display_header_footer=False,
+        )
+        return pdf_bytes
+    finally:
+        page.close()
 
-        report = results_coll.find_one({"_id": oid})
-        if not report: return jsonify({"error": "Report not found"}), 404
 
-        user_id = getattr(request, "user_id", None)
-        user_role = getattr(request, "user_role", None)
-        if not ids_match(user_id, report.get("userId")) and user_role not in ["ttc_coordinator", "college_admin", "super_admin"]:
-            return jsonify({"error": "Unauthorized"}), 403
+def render_pdf(html_content):
+    """Render an HTML document to PDF bytes on a pooled browser."""
+    return _pdf_executor.submit(_render_pdf, html_content).result()
 
-        # 2. Extract Data
-        idea_oid = parse_oid(report.get("ideaId"))
-        idea = ideas_coll.find_one({"_id": idea_oid}) if idea_oid else None
-        idea_title = idea.get("title", "Innovation Report") if idea else "Innovation Report"
-        overall_score = report.get("overallScore", 0)
 
-        bc_json = report.get("businessCaseJson", {}) or {}
-        ra_json = report.get("riskAssessmentJson", {}) or {}
-        sg_json = report.get("strategicGrowthViabilityJson", {}) or {}
-
-        # ---------------------------------------------------------
-        # RATE LIMITING CHECK (Max 10 distinct ideas per college/month)
-        # ---------------------------------------------------------
-        # 1. Resolve College ID
-        college_id = idea.get("collegeId")
-        if not college_id:
-            # Fallback: Try to find via innovator -> TTC
-            innovator_id = idea.get("innovatorId")
-            innovator = users_coll.find_one({"_id": parse_oid(innovator_id)})
-            if innovator:
-                ttc_id = innovator.get("ttcCoordinatorId")
-                if ttc_id:
-                    ttc = users_coll.find_one({"_id": parse_oid(ttc_id)})
-                    if ttc:
-                        college_id = ttc.get("collegeId")
-        
-        # 2. Check Limit if college identified
-        if college_id and user_role != "super_admin": # Super admin bypass
-            college_id_str = str(college_id)
-            now_utc = datetime.now(timezone.utc)
-            start_of_month = datetime(now_utc.year, now_utc.month, 1, tzinfo=timezone.utc)
-            
-            # Count distinct ideas reported this month for this college
+def _close_renderer(barrier):
+    # Hold this worker until every worker has picked up a close task, so
+    # each thread gets exactly one - Playwright objects can only be closed
+    # from the thread that created them
+    try:
+        barrier.wait(timeout=10)
+    except threading.BrokenBarrierError:
+        pass
+    for name in ("context", "browser"):
+        obj = getattr(_renderer, name, None)
+        if obj is not None:
+            try:
+                obj.close()
+            except Exception as e:
+                logger.debug("Closing PDF %s failed: %s", name, e)
+    playwright = getattr(_renderer, "playwright", None)
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception as e:
+            logger.debug("Stopping Playwright failed: %s", e)
+    _renderer.__dict__.clear()
+    with _renderer_threads_lock:
+        _renderer_threads.discard(threading.get_ident())
+
+
+def close_pdf_renderers():
+    """Close every render thread's browser context, browser and Playwright driver."""
+    if not _renderer_threads:
+        return
+    barrier = threading.Barrier(PDF_RENDER_WORKERS)
+    closing = [_pdf_executor.submit(_close_renderer, barrier) for _ in range(PDF_RENDER_WORKERS)]
+    for future in closing:
+        future.result()
+    logger.info("🧭 Closed PDF rendering browsers")
+
+
+# Registered with threading's exit hooks rather than atexit: those run
+# before concurrent.futures stops the executor (the same hook it uses),
+# while atexit handlers only run once the render threads have exited
+threading._register_atexit(close_pdf_renderers)
+
+
+# Rendered PDFs, most recently used last. The key carries the result's
+# write stamp and everything else the document embeds (title, score and
+# the "Generated" date), so a regenerated report never hits a stale entry.
+PDF_CACHE_SIZE = int(os.getenv("PDF_CACHE_SIZE", 32))
+_pdf_cache = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+
+def _cached_pdf(key):
+    with _pdf_cache_lock:
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is not None:
+            _pdf_cache.move_to_end(key)
+        return pdf_bytes
+
+
+def _store_pdf(key, pdf_bytes):
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf_bytes
+        _pdf_cache.move_to_end(key)
+        while len(_pdf_cache) > PDF_CACHE_SIZE:
+            _pdf_cache.popitem(last=False)
+
+
+# Usage records for the monthly limit are written off the request path.
+# The limit check in this process sees a new idea immediately through
+# _remember_pdf_usage; other workers see it once the insert lands.
+_usage_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-usage")
+
+
+def _log_pdf_usage(usage_doc):
+    try:
+        generated_reports_coll.insert_one(usage_doc)
+        logger.info(f"✅ Usage logged for College {usage_doc['collegeId']} (Idea: {usage_doc['ideaId']})")
+    except Exception as e:
+        logger.error(f"⚠️ Failed to log report usage: {e}")
+
+
+# ---------------------------- Routes ----------------------------
+
+# Only the fields the infographic reads; result documents also carry the
+# full AI transcripts and version history.
+_RESULT_PDF_PROJ = {
+    "businessCaseJson": 1, "riskAssessmentJson": 1, "strategicGrowthViabilityJson": 1,
+    "overallScore": 1, "ideaId": 1, "userId": 1, "updatedAt": 1, "createdAt": 1,
+}
+_IDEA_PDF_PROJ = {"title": 1, "collegeId": 1}
+
+# Result documents are read raw: the small top-level fields decode on
+# first access while the three analysis trees stay as BSON bytes, so a
+# PDF cache hit never decodes them.
+_raw_results_coll = results_coll.with_options(
+    codec_options=CodecOptions(document_class=RawBSONDocument)
+)
+
+
+def _analysis_section(report, field):
+    """One analysis tree of a raw result document as a plain dict."""
+    section = report.get(field)
+    return bson_decode(section.raw) if isinstance(section, RawBSONDocument) else {}
+
+
+def find_infographic_report(oid):
+    """Load a validation result with just the fields the infographic needs."""
+    return _raw_results_coll.find_one({"_id": oid}, _RESULT_PDF_PROJ)
+
+
+def infographic_pdf_response(report, user_id, user_role):
+    """
+    Render (or reuse) the infographic PDF for `report`, a result loaded by
+    find_infographic_report, and return it as a download.
+
+    Access must already have been checked by the caller; the college
+    monthly limit is applied here.
+    """
+    oid = report["_id"]
+
+    # Extract Data
+    idea_oid = parse_oid(report.get("ideaId"))
+    idea = ideas_coll.find_one({"_id": idea_oid}, _IDEA_PDF_PROJ) if idea_oid else None
+    idea_title = idea.get("title", "Innovation Report") if idea else "Innovation Report"
+    overall_score = report.get("overallScore", 0)
+
+    # ---------------------------------------------------------
+    # RATE LIMITING CHECK (Max 10 distinct ideas per college/month)
+    # ---------------------------------------------------------
+    # 1. College ID (set on the idea at submission; older ideas via backfill_idea_college_ids.py)
+    college_id = idea.get("collegeId") if idea else None
+
+    # 2. Check Limit if college identified
+    if college_id and user_role != "super_admin": # Super admin bypass
+        college_id_str = str(college_id)
+        start_of_month = _month_start(datetime.now(timezone.utc))
+        usage_key = (college_id_str, start_of_month)
+        idea_key = str(idea_oid)
+
+        known = _pdf_usage_cache.get(usage_key, frozenset())
+        if idea_key in known or len(known) >= PDF_MONTHLY_LIMIT:
+            current_count = len(known)
+            is_new_report = idea_key not in known
+        else:
+            # Count distinct ideas reported this month for this college and
+            # check whether THIS idea is among them (idempotency) in one pass.
             # (Note: generated_reports_coll stores 'ideaId' as string or ObjectId - we handle both usually, 
             # but ideally we store consistent formats. Here filtering by string representation for safety)
-            
             pipeline = [
                 {
                     "$match": {
@@ -724,97 +903,91 @@ def download_infographic_pdf(report_id):
                 },
                 {
                     "$group": {
-                        "_id": "$ideaId"
+                        "_id": None,
+                        "ideas": {"$addToSet": "$ideaId"},
+                        "has_this": {"$max": {"$cond": [{"$eq": ["$ideaId", idea_key]}, 1, 0]}}
                     }
                 },
                 {
-                    "$count": "distinct_ideas"
+                    "$project": {
+                        "_id": 0,
+                        "ideas": 1,
+                        "distinct_ideas": {"$size": "$ideas"},
+                        "has_this": 1
+                    }
                 }
             ]
-            
-            count_res = list(generated_reports_coll.aggregate(pipeline))
-            current_count = count_res[0]["distinct_ideas"] if count_res else 0
-            
-            # Check if THIS idea is already generated (idempotency)
-            is_new_report = not generated_reports_coll.find_one({
-                "collegeId": college_id_str,
-                "ideaId": str(idea_oid),
-                "type": "PDF",
-                "createdAt": {"$gte": start_of_month}
-            })
-            
-            if is_new_report and current_count >= 10:
-                logger.warning(f"⛔ Rate limit exceeded for College {college_id_str}: {current_count}/10")
-                return jsonify({
-                    "error": "Monthly report limit reached",
-                    "message": "Your college has reached the limit of 10 reports per month. Please contact support."
-                }), 429
 
+            usage = next(generated_reports_coll.aggregate(pipeline), None) or {}
+            current_count = usage.get("distinct_ideas", 0)
+            is_new_report = not usage.get("has_this")
+            _remember_pdf_usage(usage_key, (str(i) for i in usage.get("ideas", [])))
+        
+        if is_new_report and current_count >= PDF_MONTHLY_LIMIT:
+            logger.warning(f"⛔ Rate limit exceeded for College {college_id_str}: {current_count}/{PDF_MONTHLY_LIMIT}")
+            return jsonify({
+                "error": "Monthly report limit reached",
+                "message": f"Your college has reached the limit of {PDF_MONTHLY_LIMIT} reports per month. Please contact support."
+            }), 429
+
+    cache_key = (
+        oid, report.get("updatedAt") or report.get("createdAt"),
+        idea_title, overall_score, datetime.now().date()
+    )
+    pdf_bytes = _cached_pdf(cache_key)
+    if pdf_bytes is None:
         # 3. Build HTML (Now with Modern CSS)
+        bc_json = _analysis_section(report, "businessCaseJson")
+        ra_json = _analysis_section(report, "riskAssessmentJson")
+        sg_json = _analysis_section(report, "strategicGrowthViabilityJson")
         html_content = build_full_html(idea_title, overall_score, bc_json, ra_json, sg_json)
 
         # 4. Generate PDF with Playwright
         if not PLAYWRIGHT_AVAILABLE:
             return jsonify({"error": "Playwright is not installed on the server."}), 500
 
-        with sync_playwright() as p:
-            # Launch Chromium (Headless)
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            # Load HTML content
-            # wait_until="networkidle" ensures fonts/assets are loaded
-            page.set_content(html_content, wait_until="networkidle")
-            
-            # Create PDF
-            pdf_bytes = page.pdf(
-                format="A4",
-                print_background=True, # Essential for colors/shadows
-                margin={
-                    "top": "20mm",
-                    "right": "20mm",
-                    "bottom": "20mm",
-                    "left": "20mm"
-                },
-                display_header_footer=True,
-                # CSS in footer template must be inline or standard HTML
-                footer_template="""
-                    <div style="font-size: 10px; color: #9ca3af; font-family: sans-serif; width: 100%; text-align: center; border-top: 1px solid #e5e7eb; padding-top: 10px; margin: 0 20mm;">
-                        <span>Pragati Innovation Platform &nbsp;|&nbsp; Confidential Report</span>
-                        <span style="float: right;">Page <span class="pageNumber"></span> of <span class="totalPages"></span></span>
-                    </div>
-                """,
-                header_template="<div></div>" # Empty header to avoid default
-            )
-            
-            browser.close()
-
-        # ---------------------------------------------------------
-        # LOG USAGE (After successful generation)
-        # ---------------------------------------------------------
-        if college_id: # Only log if associated with a college
-            try:
-                generated_reports_coll.insert_one({
-                    "userId": str(user_id) if user_id else None,
-                    "collegeId": str(college_id),
-                    "ideaId": str(idea_oid),
-                    "reportName": f"Infographic - {idea_title}",
-                    "type": "PDF",
-                    "status": "Generated",
-                    "createdAt": datetime.now(timezone.utc)
-                })
-                logger.info(f"✅ Usage logged for College {college_id} (Idea: {idea_oid})")
-            except Exception as e:
-                logger.error(f"⚠️ Failed to log report usage: {e}")
-
-        # 5. Send File
-        filename = f"pragati_report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            io.BytesIO(pdf_bytes),
-            mimetype="application/pdf",
-            as_attachment=True,
-            download_name=filename,
-        )
+        pdf_bytes = render_pdf(html_content)
+        _store_pdf(cache_key, pdf_bytes)
+
+    # ---------------------------------------------------------
+    # LOG USAGE (After successful generation)
+    # ---------------------------------------------------------
+    if college_id: # Only log if associated with a college
+        created_at = datetime.now(timezone.utc)
+        _remember_pdf_usage((str(college_id), _month_start(created_at)), [str(idea_oid)])
+        _usage_log_executor.submit(_log_pdf_usage, {
+            "userId": str(user_id) if user_id else None,
+            "collegeId": str(college_id),
+            "ideaId": str(idea_oid),
+            "reportName": f"Infographic - {idea_title}",
+            "type": "PDF",
+            "status": "Generated",
+            "createdAt": created_at
+        })
+
+    # 5. Send File - a bytes body goes out in one write with its
+    # Content-Length, without a BytesIO wrapper read in blocks
+    filename = f"pragati_report_{datetime.now().strftime('%Y%m%d')}.pdf"
+    return set_attachment(Response(pdf_bytes, mimetype="application/pdf"), filename)
+
+
+@reports_pdf_bp.route("/<report_id>/infographic-pdf", methods=["GET"])
+@requires_auth()
+def download_infographic_pdf(report_id):
+    try:
+        # 1. Validation & Data Fetching
+        oid = parse_oid(report_id)
+        if not oid: return jsonify({"error": "Invalid report ID"}), 400
+
+        report = find_infographic_report(oid)
+        if not report: return jsonify({"error": "Report not found"}), 404
+
+        user_id = getattr(request, "user_id", None)
+        user_role = getattr(request, "user_role", None)
+        if not ids_match(user_id, report.get("userId")) and user_role not in ["ttc_coordinator", "college_admin", "super_admin"]:
+            return jsonify({"error": "Unauthorized"}), 403
+
+        return infographic_pdf_response(report, user_id, user_role)
 
     except Exception as e:
         logger.error(f"Error generating PDF: {e}")
@@ -826,10 +999,10 @@ def preview_infographic(report_id):
     """HTML preview for debugging in browser."""
     try:
         oid = parse_oid(report_id)
-        report = results_coll.find_one({"_id": oid})
+        report = results_coll.find_one({"_id": oid}, _RESULT_PDF_PROJ)
         
         idea_oid = parse_oid(report.get("ideaId"))
-        idea = ideas_coll.find_one({"_id": idea_oid})
+        idea = ideas_coll.find_one({"_id": idea_oid}, _IDEA_PDF_PROJ)
         idea_title = idea.get("title", "Innovation Report")
         overall_score = report.get("overallScore", 0)
 
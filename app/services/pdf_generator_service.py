@@ -10,11 +10,14 @@ import os
 import base64
 import logging
 from datetime import datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape as xml_escape
 from xhtml2pdf import pisa
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
+from PIL import Image, ImageChops
 
 # Import utilities
 from app.utils.data_processors import DataProcessor
@@ -22,6 +25,82 @@ from app.utils.data_processors import DataProcessor
 logger = logging.getLogger(__name__)
 
 
+def _figure_png_b64(fig, dpi):
+    """
+    Base64 PNG of a matplotlib figure (closed afterwards), trimmed to its
+    content like bbox_inches='tight' and quantized to a 64-colour palette.
+    Charts are flat colours on white, so the paletted PNG is a fraction of
+    Agg's RGBA output and quicker to compress.
+    """
+    try:
+        fig.set_facecolor('white')
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())[..., :3])
+    finally:
+        plt.close(fig)
+    
+    content = ImageChops.difference(image, Image.new('RGB', image.size, 'white')).getbbox()
+    if content:
+        pad = 8
+        image = image.crop((
+            max(content[0] - pad, 0), max(content[1] - pad, 0),
+            min(content[2] + pad, image.width), min(content[3] + pad, image.height)
+        ))
+    
+    img_buffer = io.BytesIO()
+    image.quantize(colors=64, method=Image.Quantize.MEDIANCUT).save(img_buffer, format='PNG', optimize=True)
+    return base64.b64encode(img_buffer.getbuffer()).decode('utf-8')
+
+
+@lru_cache(maxsize=128)
+def _spider_chart_svg(labels, values):
+    """
+    SVG markup of the cluster spider chart: a 0-100 radial scale, one spoke
+    per cluster and the score polygon. Arguments are tuples so the result
+    can be memoized across reports.
+    """
+    width, height, cx, cy, radius = 760, 680, 380, 360, 220
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False)
+    cos, sin = np.cos(angles), np.sin(angles)
+    tick_cos, tick_sin = np.cos(np.pi / 8), np.sin(np.pi / 8)
+
+    svg = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Helvetica, Arial, sans-serif">',
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+        f'<text x="{cx}" y="36" text-anchor="middle" font-size="18" font-weight="bold" '
+        f'fill="#1F2937">Cluster Performance Analysis</text>',
+    ]
+
+    # Grid rings with their scale labels, and one spoke per cluster
+    for tick in (20, 40, 60, 80, 100):
+        r = radius * tick / 100
+        svg.append(f'<circle cx="{cx}" cy="{cy}" r="{r:.1f}" fill="none" stroke="#ddd" stroke-dasharray="4 3"/>')
+        svg.append(f'<text x="{cx + r * tick_cos:.1f}" y="{cy - r * tick_sin:.1f}" font-size="11" fill="#999">{tick}</text>')
+    for c, s in zip(cos, sin):
+        svg.append(f'<line x1="{cx}" y1="{cy}" x2="{cx + radius * c:.1f}" y2="{cy - radius * s:.1f}" stroke="#ddd" stroke-dasharray="4 3"/>')
+
+    # Score polygon, clipped to the 0-100 scale like the old ylim
+    r = radius * np.clip(values, 0, 100) / 100
+    xs, ys = cx + r * cos, cy - r * sin
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    svg.append(f'<polygon points="{points}" fill="#3B82F6" fill-opacity="0.25" stroke="#3B82F6" stroke-width="2.5"/>')
+    svg.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="5" fill="#3B82F6"/>' for x, y in zip(xs, ys))
+
+    # Cluster names just outside the outer ring
+    for label, c, s in zip(labels, cos, sin):
+        anchor = "start" if c > 0.1 else "end" if c < -0.1 else "middle"
+        x, y = cx + (radius + 18) * c, cy - (radius + 18) * s + 5
+        svg.append(
+            f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" font-size="13" '
+            f'font-weight="bold" fill="#333">{xml_escape(label)}</text>'
+        )
+
+    svg.append("</svg>")
+    return "".join(svg)
+
+
 class ChartGenerator:
     """Generate charts and visualizations for PDF reports."""
     
@@ -60,20 +139,14 @@ class ChartGenerator:
             
             plt.tight_layout()
             
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            return base64.b64encode(img_buffer.read()).decode('utf-8')
+            return _figure_png_b64(fig, dpi=100)
         
         except Exception as e:
             logger.error(f"❌ Score gauge generation error: {e}")
             return None
     
     def generate_spider_chart(self, cluster_scores):
-        """Generate spider/radar chart for cluster analysis."""
+        """Generate spider/radar chart for cluster analysis as an SVG data URI."""
         try:
             # Extract labels and values
             if isinstance(cluster_scores, dict):
@@ -93,36 +166,12 @@ class ChartGenerator:
             if not labels or not values:
                 return None
             
-            num_vars = len(labels)
-            angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
-            values_plot = values + values[:1]
-            angles_plot = angles + angles[:1]
-            
-            fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True), facecolor='white')
-            
-            ax.plot(angles_plot, values_plot, 'o-', linewidth=2.5, color='#3B82F6', markersize=8)
-            ax.fill(angles_plot, values_plot, alpha=0.25, color='#3B82F6')
-            
-            ax.set_xticks(angles)
-            ax.set_xticklabels(labels, fontsize=10, fontweight='bold', color='#333')
-            ax.set_ylim(0, 100)
-            ax.set_yticks([20, 40, 60, 80, 100])
-            ax.set_yticklabels(['20', '40', '60', '80', '100'], fontsize=9, color='#999')
-            ax.grid(True, linestyle='--', alpha=0.7, color='#ddd')
-            ax.set_facecolor('#ffffff')
-            
-            fig.suptitle('Cluster Performance Analysis', fontsize=14, fontweight='bold', 
-                        color='#1F2937', y=0.98)
-            
-            plt.tight_layout()
-            
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=120, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            return base64.b64encode(img_buffer.read()).decode('utf-8')
+            # Same scores (to one decimal) always draw the same chart
+            svg = _spider_chart_svg(
+                tuple(str(label) for label in labels),
+                tuple(round(float(value or 0), 1) for value in values)
+            )
+            return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
         
         except Exception as e:
             logger.error(f"❌ Spider chart generation error: {e}")
@@ -149,13 +198,7 @@ class ChartGenerator:
             
             plt.tight_layout()
             
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            return base64.b64encode(img_buffer.read()).decode('utf-8')
+            return _figure_png_b64(fig, dpi=100)
         
         except Exception as e:
             logger.error(f"❌ Risk matrix generation error: {e}")
@@ -184,13 +227,7 @@ class ChartGenerator:
             
             plt.tight_layout()
             
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            return base64.b64encode(img_buffer.read()).decode('utf-8')
+            return _figure_png_b64(fig, dpi=100)
         
         except Exception as e:
             logger.error(f"❌ Timeline generation error: {e}")
@@ -230,13 +267,7 @@ class ChartGenerator:
             
             plt.tight_layout()
             
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            return base64.b64encode(img_buffer.read()).decode('utf-8')
+            return _figure_png_b64(fig, dpi=100)
         
         except Exception as e:
             logger.error(f"❌ Score breakdown generation error: {e}")
@@ -545,7 +576,7 @@ class PDFGeneratorService:
         # Spider chart
         chart_html = ""
         if data.get('charts', {}).get('spider_chart'):
-            chart_html = f'<img src="data:image/png;base64,{data["charts"]["spider_chart"]}" style="max-width: 100%; margin: 20px 0;">'
+            chart_html = f'<img src="{data["charts"]["spider_chart"]}" style="max-width: 100%; margin: 20px 0;">'
         
         return f"""
         <!DOCTYPE html>
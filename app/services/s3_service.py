@@ -212,6 +212,35 @@ class S3Service:
         except ClientError as e:
             raise ValueError(f"Upload failed: {str(e)}")
     
+    def upload_report_file(self, data, user_id: str, filename: str, content_type: str = 'text/csv') -> str:
+        """
+        Upload a generated report (Reports Hub export) from memory or a
+        spooled temporary file.
+        
+        Args:
+            data (bytes | file-like): Encoded report content (file positioned at start)
+            user_id (str): Owner's unique ID
+            filename (str): Download filename, kept as the key suffix
+            content_type (str): MIME type (default: 'text/csv')
+            
+        Returns:
+            str: S3 object key
+        """
+        key = f"reports/{user_id}/{uuid.uuid4()}_{secure_filename(filename)}"
+        
+        try:
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=data,
+                ContentType=content_type,
+                ACL='private'
+            )
+            return key
+            
+        except ClientError as e:
+            raise ValueError(f"Failed to upload report: {str(e)}")
+    
     def move_file(self, old_key: str, new_key: str) -> str:
         """
         Move/rename file within S3 bucket (copy + delete).
@@ -0,0 +1,19 @@
+# app/utils/converters.py
+from bson import ObjectId
+from werkzeug.routing import BaseConverter
+
+
+class ObjectIdConverter(BaseConverter):
+    """
+    URL converter for ObjectId path segments, e.g. `<oid:idea_id>`.
+    
+    Anything that is not 24 hex chars fails to match the rule (404) before
+    the view runs; the view receives a ready ObjectId.
+    """
+    regex = r"[0-9a-fA-F]{24}"
+    
+    def to_python(self, value):
+        return ObjectId(value)
+    
+    def to_url(self, value):
+        return str(value)
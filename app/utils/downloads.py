@@ -0,0 +1,22 @@
+# app/utils/downloads.py
+import unicodedata
+from urllib.parse import quote
+
+
+def set_attachment(response, filename):
+    """
+    Mark `response` as a download named `filename`, the way send_file does.
+
+    Names are often user supplied (report names), so quotes are escaped by
+    the header dumper and non-ASCII names get an RFC 5987 `filename*` with
+    an ASCII `filename` fallback instead of failing to encode.
+    """
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        names = {"filename": simple, "filename*": f"UTF-8''{quote(filename, safe='!#$&+-.^_`|~')}"}
+    else:
+        names = {"filename": filename}
+    response.headers.set("Content-Disposition", "attachment", **names)
+    return response
@@ -1,5 +1,23 @@
 # app/utils/validators.py
+from functools import lru_cache
 from bson import ObjectId
+import re
+
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
+
+def is_oid_hex(value):
+    """True if `value` is a 24-char hex string, i.e. ObjectId(value) cannot fail."""
+    return isinstance(value, str) and _OID_RE.fullmatch(value) is not None
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_oid(id_value):
+    """
+    Parse a 24-char hex id, or None if it is not one. Cached: the same
+    user/TTC ids are normalized on every request, and ObjectId is immutable.
+    """
+    return ObjectId(id_value) if is_oid_hex(id_value) else None
 
 
 def normalize_user_id(user_id):
@@ -73,17 +91,18 @@ def normalize_any_id_field(field_name, id_value):
         id_value: String or ObjectId
     
     Returns:
-        dict: MongoDB query with $or condition
+        dict: MongoDB query matching either stored form of the id. Both
+        forms sit in one $in on the field itself, so the filter is a single
+        index scan and never collides with a caller's own $or.
     """
     if isinstance(id_value, ObjectId):
         return {field_name: id_value}
     
     if isinstance(id_value, str) and len(id_value) == 24:
-        try:
-            oid = ObjectId(id_value)
-            return {"$or": [{field_name: oid}, {field_name: id_value}]}
-        except:
-            return {field_name: id_value}
+        oid = _hex_to_oid(id_value)
+        if oid is not None:
+            return {field_name: {"$in": [oid, id_value]}}
+        return {field_name: id_value}
     
     return {field_name: id_value}
 
@@ -103,10 +122,8 @@ def parse_oid(id_value):
         return id_value
     
     if isinstance(id_value, str) and len(id_value) == 24:
-        try:
-            return ObjectId(id_value)
-        except:
-            return id_value
+        oid = _hex_to_oid(id_value)
+        return oid if oid is not None else id_value
     
     return id_value
 
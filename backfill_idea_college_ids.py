@@ -0,0 +1,53 @@
+"""
+One-off migration: set collegeId on ideas submitted without one.
+
+Idea submission now resolves the college through the innovator's TTC
+coordinator; this applies the same rule to ideas created before that.
+Safe to re-run - it only touches ideas that still have no collegeId.
+
+    python backfill_idea_college_ids.py
+"""
+
+import os
+import sys
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+# Ensure 'app' module can be found
+sys.path.append(os.getcwd())
+
+from app.database.mongo import ideas_coll, users_coll
+
+
+def backfill_idea_college_ids():
+    print("🔧 Backfilling collegeId on ideas...")
+
+    missing = list(ideas_coll.find(
+        {"collegeId": {"$in": [None, ""]}, "ttcCoordinatorId": {"$nin": [None, ""]}},
+        {"ttcCoordinatorId": 1}
+    ))
+    print(f"   Ideas without collegeId: {len(missing)}")
+    if not missing:
+        return
+
+    ttc_oids = {
+        ObjectId(str(idea["ttcCoordinatorId"]))
+        for idea in missing if ObjectId.is_valid(str(idea["ttcCoordinatorId"]))
+    }
+    college_by_ttc = {
+        str(ttc["_id"]): ttc["collegeId"]
+        for ttc in users_coll.find({"_id": {"$in": list(ttc_oids)}, "collegeId": {"$nin": [None, ""]}}, {"collegeId": 1})
+    }
+    updates = [
+        UpdateOne({"_id": idea["_id"]}, {"$set": {"collegeId": college_by_ttc[str(idea["ttcCoordinatorId"])]}})
+        for idea in missing if str(idea["ttcCoordinatorId"]) in college_by_ttc
+    ]
+    if updates:
+        result = ideas_coll.bulk_write(updates, ordered=False)
+        print(f"✅ Backfilled collegeId on {result.modified_count} ideas")
+    print(f"⏭️  Left unchanged (TTC has no college): {len(missing) - len(updates)}")
+
+
+if __name__ == "__main__":
+    backfill_idea_college_ids()